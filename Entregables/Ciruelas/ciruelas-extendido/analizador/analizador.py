@@ -1,27 +1,273 @@
 # Analizador de Ciruelas (el lenguaje de programación)
 
-import sys
+import json
+from collections import deque
+from inspect import isgeneratorfunction
+from time import perf_counter
 from explorador.explorador import TipoComponente, ComponenteLéxico, ErrorCompilacion
 from utils.árbol import ÁrbolSintáxisAbstracta, NodoÁrbol, TipoNodo
+from utils.árbol_plano import ÁrbolPlano
+from utils import pila
+
+class ErrorSintaxis(Exception):
+    """
+    Se levanta al reportar un error de sintaxis para abandonar las
+    producciones hasta la instrucción (o el programa) que la contiene,
+    que es donde se recupera
+    """
+
+
+class AnálisisDetenido(Exception):
+    """
+    Se levanta cuando ya no tiene sentido seguir analizando: se llegó al
+    máximo de errores o se acabó el archivo en medio de un error
+    """
+
+
+class PerfilProducciones:
+    """
+    Lleva por producción (cada __analizar_*) la cantidad de llamadas, el
+    tiempo acumulado y propio y los componentes léxicos consumidos. Se
+    usa solo si se pide con Analizador(perfil=True): en ese caso se
+    instalan en la instancia versiones envueltas de las producciones, así
+    que normalmente no cuesta nada.
+
+    Cómo en cProfile, lo acumulado incluye a las producciones hijas y lo
+    propio no. Si una producción está anidada en sí misma (bloques dentro
+    de bloques) lo acumulado se cuenta solo en la llamada de más afuera
+    para no contarlo dos veces. Lo que tarda pila.ejecutar en pasar de
+    una producción a otra le queda de tiempo propio a la que llamó.
+    """
+
+    def __init__(self, analizador):
+        self.analizador = analizador
+
+        self.llamadas = {}
+        self.acumulado = {}
+        self.propio = {}
+        self.componentes = {}
+        self.componentes_propios = {}
+
+        # Cuantas llamadas de cada producción están abiertas
+        self.__activas = {}
+
+        # Producciones abiertas: [nombre, inicio, segundos de hijas,
+        # posición inicial, componentes de hijas]
+        self.__pila = []
+
+    def envolver(self, nombre, producción):
+        """
+        Retorna la producción envuelta para que se mida. Las que son
+        generadores (ver pila.ejecutar) se envuelven con otro generador
+        para que las hijas que corre pila.ejecutar queden adentro.
+        """
+        entrar = self.entrar
+        salir = self.salir
+
+        if isgeneratorfunction(producción):
+            def medida(*argumentos):
+                entrar(nombre)
+                try:
+                    return (yield from producción(*argumentos))
+                finally:
+                    salir()
+
+        else:
+            def medida(*argumentos):
+                entrar(nombre)
+                try:
+                    return producción(*argumentos)
+                finally:
+                    salir()
+
+        return medida
+
+    def entrar(self, nombre):
+        if nombre not in self.llamadas:
+            self.llamadas[nombre] = 0
+            self.acumulado[nombre] = self.propio[nombre] = 0.0
+            self.componentes[nombre] = self.componentes_propios[nombre] = 0
+            self.__activas[nombre] = 0
+
+        self.llamadas[nombre] += 1
+        self.__activas[nombre] += 1
+        self.__pila.append([nombre, perf_counter(), 0.0, self.analizador.posición_componente_actual, 0])
+
+    def salir(self):
+        nombre, inicio, segundos_hijas, posición, componentes_hijas = self.__pila.pop()
+
+        segundos = perf_counter() - inicio
+        componentes = self.analizador.posición_componente_actual - posición
+
+        self.propio[nombre] += segundos - segundos_hijas
+        self.componentes_propios[nombre] += componentes - componentes_hijas
+
+        self.__activas[nombre] -= 1
+        if self.__activas[nombre] == 0:
+            self.acumulado[nombre] += segundos
+            self.componentes[nombre] += componentes
+
+        if self.__pila:
+            self.__pila[-1][2] += segundos
+            self.__pila[-1][4] += componentes
+
+    def reporte(self):
+        """
+        Retorna el perfil en un diccionario (se puede pasar directo a
+        json) con las producciones de más a menos tiempo propio
+        """
+        producciones = sorted(self.llamadas, key=self.propio.get, reverse=True)
+
+        return {
+            'segundos': sum(self.propio.values()),
+            'componentes': self.analizador.posición_componente_actual,
+            'producciones': {nombre: {
+                'llamadas': self.llamadas[nombre],
+                'segundos_acumulados': self.acumulado[nombre],
+                'segundos_propios': self.propio[nombre],
+                'componentes': self.componentes[nombre],
+                'componentes_propios': self.componentes_propios[nombre],
+                } for nombre in producciones},
+        }
+
+
+# Texto del componente que el Analizador pone de actual cuando se acaban
+# los componentes léxicos. No calza con ningún terminal de la gramática,
+# así que cualquier ciclo que esté esperando algo en particular se
+# detiene ahí y el __verificar que siga reporta el error.
+FIN_ARCHIVO = ''
+
+
+def nodo_suelto(tipo, linea = None, columna = None, contenido = None, nodos = None, atributos = None):
+    """
+    Fábrica de nodos de Analizador(construir=False): el nodo se crea pero
+    sin pegarle los hijos, así que cada uno se libera apenas termina la
+    producción que lo usó y el árbol nunca se arma. Las producciones solo
+    ocupan el tipo, el contenido y la posición de lo que les devuelven
+    sus hijas.
+    """
+    return NodoÁrbol(tipo, linea, columna, contenido)
+
 
 class Analizador:
 
     componentes_léxicos : list
-    cantidad_componentes: int
     posición_componente_actual : int
     componente_actual : ComponenteLéxico
 
-    def __init__(self, lista_componentes):
+    # Conjuntos PRIMERO precalculados para no andar comparando texto por
+    # texto. Las instrucciones que empiezan con IDENTIFICADOR se revisan
+    # aparte por tipo.
+    primeros_bloque = frozenset(['upee', 'diay siii', 'sarpe', 'safis',
+        'dele vuelta', 'juéguesela', 'tortón', 'llamese'])
+
+    primeros_principal = frozenset(['jefe', 'jefa'])
+
+    # Los operadores lógicos que pueden seguir en una condición
+    __operadores_condición = frozenset(['divorcio', 'casorio'])
+
+    # Conjuntos de sincronización para recuperarse de un error: dentro de
+    # un bloque se brinca hasta lo que puede empezar una instrucción (o un
+    # identificador al inicio de una línea), el '}' que cierra el bloque
+    # o una función; afuera de las funciones solo hasta la siguiente
+    # función.
+    sincronización_instrucción = frozenset(['upee', 'diay siii', 'sarpe',
+        'safis', 'dele vuelta', 'juéguesela', 'llamese', 'como está la vara',
+        '}', 'mae', 'jefe', 'jefa'])
+
+    sincronización_programa = frozenset(['mae', 'jefe', 'jefa'])
+
+    # Precedencia de los operadores matemáticos (más alto amarra más)
+    precedencias = {
+            'echele'        : 1,
+            'quitele'       : 1,
+            'chuncherequee' : 2,
+            'desmadeje'     : 2,
+            }
+
+    def __init__(self, lista_componentes, plano=False, perfil=False, máximo_errores=100, construir=True):
+        """
+        lista_componentes puede ser la lista completa de componentes
+        léxicos o cualquier iterable (por ejemplo el generador de
+        Explorador.explorar_flujo). Los componentes se van sacando
+        conforme se ocupan y solo se guardan los que se han visto por
+        adelantado con __componente_venidero.
+
+        Con plano=True el árbol se construye directamente en un
+        ÁrbolPlano (arreglos paralelos) en lugar de un NodoÁrbol por
+        nodo. Gasta mucha menos memoria en programas enormes.
+
+        Con construir=False solo se revisa la gramática: los nodos se
+        botan conforme se terminan de analizar (ver nodo_suelto) y
+        self.asa queda vacío. Junto con el flujo de
+        Explorador.explorar_flujo la memoria solo crece con el
+        anidamiento (es lo que usa --solo-validar).
+
+        Con perfil=True se mide cada producción (ver PerfilProducciones)
+        y el resultado queda en self.perfil.
+
+        Después de máximo_errores errores de sintaxis se deja de analizar.
+        """
 
         self.componentes_léxicos = lista_componentes
-        self.cantidad_componentes = len(lista_componentes)
+        self.__flujo = iter(lista_componentes)
 
-        self.posición_componente_actual = 0
-        self.componente_actual = lista_componentes[0]
+        # Componentes ya sacados del flujo pero que todavía no son el
+        # actual. La gramática es LL(1) así que casi nunca tiene nada.
+        self.__venideros = deque()
+
+        # Para la recuperación de errores: la línea del componente
+        # anterior (para saber si el actual empieza línea) y si ya se
+        # acabaron los componentes
+        self.__linea_anterior = 0
+        self.__agotado = False
 
-        self.asa = ÁrbolSintáxisAbstracta()
+        self.posición_componente_actual = 0
+        self.componente_actual = self.__sacar_componente()
+
+        # Archivo vacío o solo con comentarios
+        if self.componente_actual is None:
+            self.componente_actual = self.__fin_archivo(1, 1)
+
+        # Las producciones envueltas se guardan en la instancia y tapan a
+        # las de la clase; tiene que ser antes de armar la tabla de
+        # PRIMEROS para que ahí también queden las envueltas
+        self.perfil = None
+        if perfil:
+            self.perfil = PerfilProducciones(self)
+            for atributo, producción in vars(Analizador).items():
+                if atributo.startswith('_Analizador__analizar_'):
+                    nombre = atributo[len('_Analizador__analizar_'):]
+                    medida = self.perfil.envolver(nombre, producción)
+                    setattr(self, atributo, medida.__get__(self))
+
+        # Palabra clave -> producción que la analiza (con los métodos ya
+        # amarrados a esta instancia)
+        self.__primeros_instrucción = {
+            'como está la vara': self.__analizar_switch_case,
+            'dele vuelta': self.__analizar_dele_vuelta,
+            'juéguesela': self.__analizar_try_catch,
+            'upee': self.__analizar_repetición,
+            'diay siii': self.__analizar_bifurcación,
+            'llamese': self.__analizar_invocación,
+            'sarpe': self.__analizar_retorno,
+        }
+
+        self.construir = construir
+
+        if not construir:
+            self.asa = ÁrbolSintáxisAbstracta()
+            self.__nuevo_nodo = nodo_suelto
+        elif plano:
+            self.asa = ÁrbolPlano()
+            self.__nuevo_nodo = self.asa.nuevo_nodo
+        else:
+            self.asa = ÁrbolSintáxisAbstracta()
+            self.__nuevo_nodo = NodoÁrbol
 
         self.errores_sintaxis = []
+        self.máximo_errores = máximo_errores
+        self.__posición_último_error = None
 
     def imprimir_asa(self):
         """
@@ -38,13 +284,52 @@ class Analizador:
         """
         Método principal que inicia el análisis siguiendo el esquema de
         análisis por descenso recursivo
+
+        Ojo: las producciones que se pueden anidar (los bloques y todo lo
+        que los contiene) son generadores. En lugar de llamar directamente
+        a la producción hija hacen yield de ella y pila.ejecutar la corre,
+        así que programas con miles de niveles de anidamiento no revientan
+        el límite de recursión de python. Las expresiones no ocupan eso
+        por que se analizan con pilas propias.
+
+        Los errores no detienen el programa: se recupera de cada uno (ver
+        __sincronizar) y sigue analizando para reportarlos todos de una
+        vez. Retorna True si no hubo errores; si hubo quedan en
+        errores_sintaxis y el árbol no sirve.
         """
-        self.asa.raiz = self.__analizar_programa()
+        if self.componente_actual.texto == FIN_ARCHIVO:
+            self.errores_sintaxis.append(ErrorCompilacion('el archivo no tiene componentes léxicos', FIN_ARCHIVO, 1, 1))
+            return False
+
+        try:
+            raiz = pila.ejecutar(self.__analizar_programa())
+            if self.construir:
+                self.asa.raiz = raiz
+        except AnálisisDetenido:
+            pass
+
+        # Se consume lo que quede del flujo para que el explorador termine
+        # y reporte sus errores si los hay
+        for componente in self.__flujo:
+            pass
 
-        # Si se encontró 1 o más errores se imprimen y se detiene el programa
-        if len(self.errores_sintaxis) > 0:
-            self.imprimir_errores()
-            sys.exit()
+        return len(self.errores_sintaxis) == 0
+
+    def reporte_perfil(self):
+        """
+        Retorna el perfil de las producciones (ver
+        PerfilProducciones.reporte) o None si no se pidió
+        """
+        if self.perfil is None:
+            return None
+
+        return self.perfil.reporte()
+
+    def imprimir_perfil(self):
+        """
+        Imprime el perfil de las producciones en json
+        """
+        print(json.dumps(self.reporte_perfil(), ensure_ascii=False, indent=4))
 
     def imprimir_errores(self):
         """
@@ -54,18 +339,82 @@ class Analizador:
         for error in self.errores_sintaxis:
             print(error)
         print(f"Total de errores: {len(self.errores_sintaxis)}")
+        if len(self.errores_sintaxis) >= self.máximo_errores:
+            print(f"Se dejó de analizar después de {self.máximo_errores} errores")
 
     def __reportar_error(self, mensaje):
         """
-        Registra un error de sintaxis y avanza al siguiente token
+        Registra un error de sintaxis y abandona la producción actual
+        levantando ErrorSintaxis. La atrapa la instrucción o el programa
+        que la contiene y se recupera con __sincronizar.
+
+        Si el error es en el mismo componente que el anterior no se
+        registra: es el mismo error visto desde una producción de más
+        afuera (por ejemplo varios '}' que faltan al final del archivo).
         """
-        comp = self.componente_actual
-        err = ErrorCompilacion(mensaje, comp.texto, comp.linea, comp.columna)
-        self.errores_sintaxis.append(err)
-        # Recuperación rudimentaria: avanzar un token
-        if self.posición_componente_actual < self.cantidad_componentes - 1:
-            self.posición_componente_actual += 1
-            self.componente_actual = self.componentes_léxicos[self.posición_componente_actual]
+        if self.posición_componente_actual != self.__posición_último_error:
+            self.__posición_último_error = self.posición_componente_actual
+
+            if self.__agotado:
+                mensaje += ' y se acabó el archivo'
+
+            comp = self.componente_actual
+            err = ErrorCompilacion(mensaje, comp.texto, comp.linea, comp.columna)
+            self.errores_sintaxis.append(err)
+
+            if len(self.errores_sintaxis) >= self.máximo_errores:
+                raise AnálisisDetenido(mensaje)
+
+        # Si ya no hay más componentes no hay de donde recuperarse
+        if self.__agotado:
+            raise AnálisisDetenido(mensaje)
+
+        raise ErrorSintaxis(mensaje)
+
+    def __sincronizar(self, inicio, sincronización, identificadores=False):
+        """
+        Recuperación en modo pánico: brinca componentes hasta uno del
+        conjunto de sincronización (o, con identificadores=True, un
+        identificador que empieza línea, que seguro es una asignación).
+
+        Los bloques que empiezan mientras se brinca se brincan completos,
+        así un error en la condición de un diay siii no deja las
+        instrucciones de su bloque sueltas en el bloque de afuera.
+
+        Para no quedar en un ciclo se avanza por lo menos un componente
+        desde inicio, excepto si es un '}' (ese ya no vuelve a entrar a
+        la instrucción).
+
+        El FIN_ARCHIVO cuenta como parte de todos los conjuntos, aunque
+        se esté brincando un bloque: ahí se para y el que sigue reporta
+        lo que haya quedado sin cerrar.
+        """
+        profundidad = 0
+
+        while True:
+            componente = self.componente_actual
+
+            if componente.texto == FIN_ARCHIVO:
+                return
+
+            if profundidad == 0:
+                if componente.texto == '}' and '}' in sincronización:
+                    return
+
+                if self.posición_componente_actual != inicio:
+                    if componente.texto in sincronización:
+                        return
+
+                    if identificadores and componente.tipo is TipoComponente.IDENTIFICADOR \
+                            and componente.linea > self.__linea_anterior:
+                        return
+
+            if componente.texto == '{':
+                profundidad += 1
+            elif componente.texto == '}':
+                profundidad -= 1
+
+            self.__pasar_siguiente_componente()
 
 
     def __analizar_programa(self):
@@ -79,31 +428,32 @@ class Analizador:
         # de todos modos el Explorador ni siquiera los guarda como
         # componentes léxicos)
 
-        # pueden venir múltiples asignaciones o funciones
+        # pueden venir múltiples asignaciones o funciones y de fijo al
+        # final una función principal
         while (True):
 
-            # Si es asignación
-            if self.componente_actual.tipo == TipoComponente.IDENTIFICADOR:
-                nodos_nuevos = [self.__analizar_asignación()]
+            inicio = self.posición_componente_actual
 
-            # Si es función
-            elif (self.componente_actual.texto == 'mae'):
-                nodos_nuevos += [self.__analizar_función()]
+            try:
+                # Si es asignación
+                if self.componente_actual.tipo == TipoComponente.IDENTIFICADOR:
+                    nodos_nuevos = [self.__analizar_asignación()]
 
-            else:
-                break
+                # Si es función
+                elif (self.componente_actual.texto == 'mae'):
+                    nodos_nuevos += [(yield self.__analizar_función())]
 
-        # De fijo al final una función principal
-        if (self.componente_actual.texto in ['jefe', 'jefa']):
-            nodos_nuevos += [self.__analizar_principal()]
-        else:
-            print(f"ERROR crítico: se esperaba función principal en línea "
-                  f"{self.componente_actual.linea}, columna {self.componente_actual.columna}", 
-                  file=sys.stderr)
-            sys.exit(1)
+                elif (self.componente_actual.texto in self.primeros_principal):
+                    nodos_nuevos += [(yield self.__analizar_principal())]
+                    break
 
-        
-        return NodoÁrbol(TipoNodo.PROGRAMA, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+                else:
+                    self.__reportar_error('se esperaba función principal')
+
+            except ErrorSintaxis:
+                self.__sincronizar(inicio, self.sincronización_programa)
+
+        return self.__nuevo_nodo(TipoNodo.PROGRAMA, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
         
 
     def __analizar_asignación(self):
@@ -124,14 +474,16 @@ class Analizador:
 
         # El siguiente bloque es de opcionales
 
+        # Con paréntesis o si después del primer número/identificador
+        # viene un operador es una expresión matemática
+        if self.componente_actual.texto == '(' or \
+                (self.componente_actual.tipo in [TipoComponente.ENTERO, TipoComponente.FLOTANTE, TipoComponente.IDENTIFICADOR] \
+                and self.__sigue_operador()):
+            nodos_nuevos += [self.__analizar_expresión_matemática()]
 
-        if self.componente_actual.tipo in [TipoComponente.ENTERO, TipoComponente.FLOTANTE, TipoComponente.VALOR_VERDAD, TipoComponente.TEXTO] :
+        elif self.componente_actual.tipo in [TipoComponente.ENTERO, TipoComponente.FLOTANTE, TipoComponente.VALOR_VERDAD, TipoComponente.TEXTO] :
             nodos_nuevos += [self.__analizar_literal()]
 
-        # los paréntesis obligatorios (es un poco feo)
-        elif self.componente_actual.texto == '(': 
-            nodos_nuevos += [self.__analizar_expresión_matemática()]
-
         elif self.componente_actual.texto == 'llamese':
             nodos_nuevos += [self.__analizar_invocación()]
 
@@ -142,58 +494,128 @@ class Analizador:
         else:
             self.__reportar_error("estructura de asignación inválida")
 
-        return NodoÁrbol(TipoNodo.ASIGNACIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.ASIGNACIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
 
     def __analizar_expresión_matemática(self):
         """
-        ExpresiónMatemática ::= (Expresión) | Número | Identificador
+        ExpresiónMatemática ::= Término ((echele | quitele) Término)*
+        Término             ::= Factor ((chuncherequee | desmadeje) Factor)*
+        Factor              ::= ( ExpresiónMatemática ) | Número | Identificador
+
+        Ya no hacen falta los paréntesis en cada operación. Se analiza por
+        precedencia de operadores con dos pilas (operandos y operadores)
+        en lugar de una función por nivel, así que los paréntesis no
+        agregan recursión ni niveles al árbol.
+
+        Las operaciones seguidas de la misma precedencia quedan en un solo
+        nodo EXPRESIÓN (a echele b quitele c -> [a, +, b, -, c]) y las de
+        más precedencia quedan como un nodo EXPRESIÓN hijo.
         """
 
-        nodos_nuevos = []
-        
-        # Primera opción
-        if self.componente_actual.texto == '(':
+        operandos = []
 
-            # Los verificar no se incluyen por que son para forzar cierta
-            # forma de escribir... pero no aportan nada a la semántica
-            self.__verificar('(')
+        # Precedencia de cada operando si es un nodo EXPRESIÓN armado acá
+        # (None si no); así para pegar operaciones no hay que ir a ver los
+        # hijos del nodo, que con construir=False no se guardan
+        niveles = []
 
-            nodos_nuevos += [self.__analizar_expresión()]
+        # Operadores pendientes; None marca un paréntesis abierto
+        operadores = []
+        paréntesis_abiertos = 0
 
-            self.__verificar(')')
+        while True:
 
-        # Acá yo se que estan bien formados por que eso lo hizo el
-        # explorador... es nada más revisar las posiciones.
-        elif self.componente_actual.tipo == TipoComponente.ENTERO:
-            nodos_nuevos += [self.__verificar_entero()]
+            while self.componente_actual.texto == '(':
+                self.__verificar('(')
+                operadores.append(None)
+                paréntesis_abiertos += 1
 
-        elif self.componente_actual.tipo == TipoComponente.FLOTANTE:
-            nodos_nuevos += [self.__verificar_flotante()]
+            # Acá yo se que estan bien formados por que eso lo hizo el
+            # explorador... es nada más revisar las posiciones.
+            if self.componente_actual.tipo == TipoComponente.ENTERO:
+                operandos.append(self.__verificar_entero())
 
-        # Este código se simplifica si invierto la opción anterior y esta
-        else:
-            nodos_nuevos += [self.__verificar_identificador()]
+            elif self.componente_actual.tipo == TipoComponente.FLOTANTE:
+                operandos.append(self.__verificar_flotante())
+
+            else:
+                operandos.append(self.__verificar_identificador())
+
+            niveles.append(None)
+
+            # Un ')' de más ya no es de la expresión (es del que la llamó)
+            while paréntesis_abiertos > 0 and self.componente_actual.texto == ')':
+                self.__reducir_hasta_paréntesis(operandos, niveles, operadores)
+                self.__verificar(')')
+                paréntesis_abiertos -= 1
+
+            precedencia = self.precedencias.get(self.componente_actual.texto)
+            if precedencia is None:
+                break
+
+            while operadores and operadores[-1] is not None and \
+                    self.precedencias[operadores[-1].contenido] >= precedencia:
+                self.__reducir(operandos, niveles, operadores)
+
+            operadores.append(self.__verificar_operador())
 
-        return NodoÁrbol(TipoNodo.EXPRESIÓN_MATEMÁTICA, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        # Si quedó algún paréntesis sin cerrar se reporta igual que antes
+        for _ in range(paréntesis_abiertos):
+            self.__reducir_hasta_paréntesis(operandos, niveles, operadores)
+            self.__verificar(')')
+
+        self.__reducir_hasta_paréntesis(operandos, niveles, operadores)
 
+        return self.__nuevo_nodo(TipoNodo.EXPRESIÓN_MATEMÁTICA, self.componente_actual.linea, self.componente_actual.columna, nodos=operandos)
 
-    def __analizar_expresión(self):
+
+    def __reducir(self, operandos, niveles, operadores):
         """
-        Expresión ::= ExpresiónMatemática Operador ExpresiónMatemática
+        Saca el último operador con sus dos operandos y deja en su lugar
+        el nodo EXPRESIÓN
+
+        Si el operando izquierdo ya es una expresión de la misma
+        precedencia se le pega la operación al final en lugar de crear
+        otro nivel (vale por que todos asocian a la izquierda).
         """
+        operador = operadores.pop()
+        precedencia = self.precedencias[operador.contenido]
 
-        nodos_nuevos = []
+        derecho = operandos.pop()
+        niveles.pop()
+        izquierdo = operandos[-1]
 
-        # Acá no hay nada que hacer todas son obligatorias en esas
-        # posiciones
-        nodos_nuevos += [self.__analizar_expresión_matemática()]
+        if niveles[-1] == precedencia:
+            izquierdo.nodos += [operador, derecho]
 
-        nodos_nuevos += [self.__verificar_operador()]
+        else:
+            operandos[-1] = self.__nuevo_nodo(TipoNodo.EXPRESIÓN, operador.linea, operador.columna, nodos=[izquierdo, operador, derecho])
+            niveles[-1] = precedencia
 
-        nodos_nuevos += [self.__analizar_expresión_matemática()]
 
-        return NodoÁrbol(TipoNodo.EXPRESIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+    def __reducir_hasta_paréntesis(self, operandos, niveles, operadores):
+        """
+        Reduce todos los operadores pendientes hasta el último paréntesis
+        abierto (y lo saca) o hasta vaciar la pila
+        """
+        while operadores:
+            if operadores[-1] is None:
+                operadores.pop()
+                return
+            self.__reducir(operandos, niveles, operadores)
+
+
+    def __sigue_operador(self):
+        """
+        Dice si el componente después del actual es un operador
+        matemático
+        """
+        try:
+            return self.__componente_venidero().texto in self.precedencias
+        except IndexError:
+            return False
+
 
     def __analizar_función(self):
         """
@@ -210,10 +632,10 @@ class Analizador:
         self.__verificar('(')
         nodos_nuevos += [self.__analizar_parámetros_función()]
         self.__verificar(')')
-        nodos_nuevos += [self.__analizar_bloque_instrucciones()]
+        nodos_nuevos += [(yield self.__analizar_bloque_instrucciones())]
 
         # La función lleva el nombre del identificador
-        return NodoÁrbol(TipoNodo.FUNCIÓN, self.componente_actual.linea, self.componente_actual.columna, \
+        return self.__nuevo_nodo(TipoNodo.FUNCIÓN, self.componente_actual.linea, self.componente_actual.columna, \
                 contenido=nodos_nuevos[0].contenido, nodos=nodos_nuevos)
 
     def __analizar_invocación(self):
@@ -230,7 +652,7 @@ class Analizador:
         nodos_nuevos += [self.__analizar_parámetros_invocación()]
         self.__verificar(')')
 
-        return NodoÁrbol(TipoNodo.INVOCACIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.INVOCACIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
     def __analizar_parámetros_función(self):
         """
@@ -248,7 +670,7 @@ class Analizador:
         # Esto funciona con lógica al verrís... Si no revienta con error
         # asumimos que todo bien y seguimos.
 
-        return NodoÁrbol(TipoNodo.PARÁMETROS_FUNCIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.PARÁMETROS_FUNCIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
     def __analizar_parámetros_invocación(self):
         """
@@ -259,7 +681,7 @@ class Analizador:
 
         # Si el siguiente token es ')', volvemos un nodo vacío sin parámetros
         if self.componente_actual.texto == ')':
-            return NodoÁrbol(
+            return self.__nuevo_nodo(
                 TipoNodo.PARÁMETROS_INVOCACIÓN,
                 self.componente_actual.linea,
                 self.componente_actual.columna,
@@ -274,7 +696,7 @@ class Analizador:
             self.__verificar('/')                  # consumimos el '/'
             nodos_nuevos.append(self.__analizar_valor())
 
-        return NodoÁrbol(
+        return self.__nuevo_nodo(
             TipoNodo.PARÁMETROS_INVOCACIÓN,
             self.componente_actual.linea,
             self.componente_actual.columna,
@@ -296,40 +718,31 @@ class Analizador:
         Instrucción ::= (Repetición | Bifurcación | Asignación | Invocación | Retorno | Error | Comentario | TryCatch | SwitchCase)
         """
 
-        nodos_nuevos = []        
-
-        # Acá todo con if por que son opcionales
-        if self.componente_actual.texto == 'como está la vara':
-            nodos_nuevos += [self.__analizar_switch_case()]
+        # Acá antes había un montón de if; ahora se busca la producción
+        # por la palabra clave con que empieza (el conjunto PRIMERO)
+        analizar = self.__primeros_instrucción.get(self.componente_actual.texto)
 
-        elif self.componente_actual.texto == 'dele vuelta':
-            nodos_nuevos += [self.__analizar_dele_vuelta()]
-
-        elif self.componente_actual.texto == 'juéguesela':
-            nodos_nuevos += [self.__analizar_try_catch()]
-
-        elif self.componente_actual.texto == 'upee':
-            nodos_nuevos += [self.__analizar_repetición()]
-
-        elif self.componente_actual.texto == 'diay siii':
-            nodos_nuevos += [self.__analizar_bifurcación()]
-        
-        elif self.componente_actual.texto == 'llamese':
-                nodos_nuevos += [self.__analizar_invocación()]
+        if analizar is None:
+            if self.componente_actual.tipo == TipoComponente.IDENTIFICADOR:
+                analizar = self.__analizar_asignación
+            else: # Muy apropiado el chiste de ir a revisar si tiene error al último.
+                analizar = self.__analizar_error
 
-        elif self.componente_actual.tipo == TipoComponente.IDENTIFICADOR:
-                nodos_nuevos += [self.__analizar_asignación()]
+        inicio = self.posición_componente_actual
 
-        elif self.componente_actual.texto == 'sarpe':
-            nodos_nuevos += [self.__analizar_retorno()]
+        try:
+            nodos_nuevos = [(yield analizar())]
 
-        else: # Muy apropiado el chiste de ir a revisar si tiene error al último.
-            nodos_nuevos += [self.__analizar_error()]
+        # Si algo falló adentro se brinca hasta donde se pueda seguir y la
+        # instrucción queda vacía
+        except ErrorSintaxis:
+            self.__sincronizar(inicio, self.sincronización_instrucción, identificadores=True)
+            nodos_nuevos = []
 
         # Ignorado el comentario
 
         # Acá yo debería volarme el nivel Intrucción por que no aporta nada
-        return NodoÁrbol(TipoNodo.INSTRUCCIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.INSTRUCCIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
     
     def __analizar_try_catch(self):
         """
@@ -339,13 +752,13 @@ class Analizador:
         
         # Bloque try
         self.__verificar('juéguesela')
-        nodos_nuevos += [self.__analizar_bloque_instrucciones()]
+        nodos_nuevos += [(yield self.__analizar_bloque_instrucciones())]
         
         # Bloque catch
         self.__verificar('tortón')
-        nodos_nuevos += [self.__analizar_bloque_instrucciones()]
+        nodos_nuevos += [(yield self.__analizar_bloque_instrucciones())]
         
-        return NodoÁrbol(TipoNodo.TRY_CATCH, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.TRY_CATCH, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
     def __analizar_dele_vuelta(self):
         """
@@ -374,9 +787,9 @@ class Analizador:
         self.__verificar(')')
         
         # Bloque de instrucciones
-        nodos_nuevos += [self.__analizar_bloque_instrucciones()]
+        nodos_nuevos += [(yield self.__analizar_bloque_instrucciones())]
         
-        return NodoÁrbol(TipoNodo.DELE_VUELTA, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.DELE_VUELTA, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
     def __analizar_switch_case(self):
         """
@@ -395,15 +808,15 @@ class Analizador:
         
         # Al menos un caso (movida)
         while self.componente_actual.texto == 'movida':
-            nodos_nuevos += [self.__analizar_movida()]
+            nodos_nuevos += [(yield self.__analizar_movida())]
         
         # Caso default opcional
         if self.componente_actual.texto == 'sino ni modo':
-            nodos_nuevos += [self.__analizar_sino()]
+            nodos_nuevos += [(yield self.__analizar_sino())]
         
         self.__verificar('}')
         
-        return NodoÁrbol(TipoNodo.SWITCH_CASE, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.SWITCH_CASE, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
     def __analizar_movida(self):
         """
@@ -413,9 +826,9 @@ class Analizador:
         
         self.__verificar('movida')
         nodos_nuevos += [self.__analizar_valor()]
-        nodos_nuevos += [self.__analizar_bloque_instrucciones()]
+        nodos_nuevos += [(yield self.__analizar_bloque_instrucciones())]
         
-        return NodoÁrbol(TipoNodo.MOVIDA, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.MOVIDA, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
     def __analizar_repetición(self):
         """
@@ -433,9 +846,9 @@ class Analizador:
         # instrucciones o pongo directamente las instrucciones en este
         # nivel... yo voy con la primera por facilidad... pero eso hace más
         # grande el árbol
-        nodos_nuevos += [self.__analizar_bloque_instrucciones()]
+        nodos_nuevos += [(yield self.__analizar_bloque_instrucciones())]
 
-        return NodoÁrbol(TipoNodo.REPETICIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.REPETICIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
         
 
     def __analizar_bifurcación(self):
@@ -445,13 +858,13 @@ class Analizador:
         nodos_nuevos = []
 
         # el sino es opcional
-        nodos_nuevos += [self.__analizar_diaysi()]
+        nodos_nuevos += [(yield self.__analizar_diaysi())]
 
         if self.componente_actual.texto == 'sino ni modo':
-            nodos_nuevos += [self.__analizar_sino()]
+            nodos_nuevos += [(yield self.__analizar_sino())]
 
         # y sino era solo el 'diay siii'
-        return NodoÁrbol(TipoNodo.BIFURCACIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.BIFURCACIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
     def __analizar_diaysi(self):
         """
@@ -465,9 +878,9 @@ class Analizador:
         nodos_nuevos += [self.__analizar_condición()]
         self.__verificar(')')
 
-        nodos_nuevos += [self.__analizar_bloque_instrucciones()]
+        nodos_nuevos += [(yield self.__analizar_bloque_instrucciones())]
 
-        return NodoÁrbol(TipoNodo.DIAYSI, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.DIAYSI, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
     def __analizar_sino(self):
         """
@@ -478,44 +891,52 @@ class Analizador:
 
         # Todos presentes en ese orden... sin opciones
         self.__verificar('sino ni modo')
-        nodos_nuevos += [self.__analizar_bloque_instrucciones()]
+        nodos_nuevos += [(yield self.__analizar_bloque_instrucciones())]
 
-        return NodoÁrbol(TipoNodo.SINO, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.SINO, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
     def __analizar_condición(self):
         """
-        Condición ::= Comparación ((divorcio|casorio) Comparación)?
-        """
-        nodos_nuevos = []
+        Condición  ::= Conjunción (divorcio Conjunción)*
+        Conjunción ::= Comparación (casorio Comparación)*
 
-        # La primera sección obligatoria la comparación
-        nodos_nuevos += [self.__analizar_comparación()]
+        El casorio (y) amarra más que el divorcio (o). Igual que en las
+        expresiones, los casorios seguidos quedan en un solo nodo
+        CONDICIÓN que es hijo del de los divorcios.
+        """
+        # Cada conjunción es una lista [Comparación, casorio, Comparación, ...]
+        conjunciones = [[self.__analizar_comparación()]]
+        divorcios = []
 
-        # Esta parte es opcional
-        if self.componente_actual.tipo == TipoComponente.PALABRA_CLAVE:
+        # Ojo que divorcio y casorio vienen del explorador como OPERADOR
+        while self.componente_actual.texto in self.__operadores_condición:
 
-            # Acá estoy en problemas por que esto debió ser un nuevo nivel
-            # en el árbol algo ási cómo OperadorLógico...  voy a hacer una
-            # porquería... pero a ustedes les toca arreglarlo
+            nodo = self.__nuevo_nodo(TipoNodo.OPERADOR_LÓGICO, self.componente_actual.linea, self.componente_actual.columna, contenido=self.componente_actual.texto)
+            self.__verificar(nodo.contenido)
 
-            # opcional el AND o el OR
-            if self.componente_actual.texto == 'divorcio':
-                nodo = NodoÁrbol(TipoNodo.OPERADOR_LÓGICO, self.componente_actual.linea, self.componente_actual.columna, contenido='divorcio')
-                nodos_nuevos += [nodo]
-                self.__verificar('divorcio')
+            if nodo.contenido == 'casorio':
+                conjunciones[-1] += [nodo, self.__analizar_comparación()]
+            else:
+                divorcios += [nodo]
+                conjunciones += [[self.__analizar_comparación()]]
 
+        if len(conjunciones) == 1:
+            nodos_nuevos = conjunciones[0]
 
-            else: # Aquí hay potencial horrible para fallo
-                nodo = NodoÁrbol(TipoNodo.OPERADOR_LÓGICO, self.componente_actual.linea, self.componente_actual.columna, contenido='casorio')
-                nodos_nuevos += [nodo]
+        else:
+            nodos_nuevos = []
 
-                self.__verificar('casorio')
+            for posición, conjunción in enumerate(conjunciones):
+                if posición > 0:
+                    nodos_nuevos += [divorcios[posición-1]]
 
-            # Un poco tieso, pero funcional
-            nodos_nuevos += [self.__analizar_comparación()]
+                if len(conjunción) == 1:
+                    nodos_nuevos += conjunción
+                else:
+                    nodos_nuevos += [self.__nuevo_nodo(TipoNodo.CONDICIÓN, conjunción[1].linea, conjunción[1].columna, nodos=conjunción)]
 
         # Si no ha reventado vamos bien
-        return NodoÁrbol(TipoNodo.CONDICIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.CONDICIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
 
     def __analizar_comparación(self):
@@ -529,7 +950,7 @@ class Analizador:
         nodos_nuevos += [self.__verificar_comparador()]
         nodos_nuevos += [self.__analizar_valor()]
 
-        return NodoÁrbol(TipoNodo.COMPARACIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.COMPARACIÓN, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
     def __analizar_valor(self):
         """
@@ -560,7 +981,7 @@ class Analizador:
             nodos_nuevos += [self.__analizar_valor()]
 
         # Sino todo bien...
-        return NodoÁrbol(TipoNodo.RETORNO, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.RETORNO, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
     def __analizar_error(self):
         """
@@ -572,7 +993,7 @@ class Analizador:
         self.__verificar('safis')
         nodos_nuevos += [self.__analizar_valor()]
 
-        return NodoÁrbol(TipoNodo.ERROR, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.ERROR, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
     def __analizar_principal(self):
         """
@@ -589,9 +1010,9 @@ class Analizador:
 
         self.__verificar('mae')
 
-        nodos_nuevos += [self.__analizar_bloque_instrucciones()]
+        nodos_nuevos += [(yield self.__analizar_bloque_instrucciones())]
 
-        return NodoÁrbol(TipoNodo.PRINCIPAL, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.PRINCIPAL, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
 
     def __analizar_literal(self):
@@ -635,18 +1056,18 @@ class Analizador:
         self.__verificar('{')
 
         # mínimo una
-        nodos_nuevos += [self.__analizar_instrucción()]
+        nodos_nuevos += [(yield self.__analizar_instrucción())]
 
         # Acá todo puede venir uno o más 
-        while self.componente_actual.texto in ['upee', 'diay siii', 'sarpe', 'safis', 'dele vuelta', 'juéguesela', 'tortón', 'llamese'] \
+        while self.componente_actual.texto in self.primeros_bloque \
                 or self.componente_actual.tipo == TipoComponente.IDENTIFICADOR:
         
-            nodos_nuevos += [self.__analizar_instrucción()]
+            nodos_nuevos += [(yield self.__analizar_instrucción())]
 
         # Obligatorio
         self.__verificar('}')
 
-        return NodoÁrbol(TipoNodo.BLOQUE_INSTRUCCIONES, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
+        return self.__nuevo_nodo(TipoNodo.BLOQUE_INSTRUCCIONES, self.componente_actual.linea, self.componente_actual.columna, nodos=nodos_nuevos)
 
 # Todos estos verificar se pueden unificar =*=
     def __verificar_operador(self):
@@ -655,7 +1076,7 @@ class Analizador:
         """
         self.__verificar_tipo_componente(TipoComponente.OPERADOR)
 
-        nodo = NodoÁrbol(TipoNodo.OPERADOR, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
+        nodo = self.__nuevo_nodo(TipoNodo.OPERADOR, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
         self.__pasar_siguiente_componente()
 
         return nodo
@@ -666,7 +1087,7 @@ class Analizador:
         """
         self.__verificar_tipo_componente(TipoComponente.VALOR_VERDAD)
 
-        nodo = NodoÁrbol(TipoNodo.VALOR_VERDAD, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
+        nodo = self.__nuevo_nodo(TipoNodo.VALOR_VERDAD, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
         self.__pasar_siguiente_componente()
         return nodo
 
@@ -676,7 +1097,7 @@ class Analizador:
         """
         self.__verificar_tipo_componente(TipoComponente.COMPARADOR)
 
-        nodo = NodoÁrbol(TipoNodo.COMPARADOR, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
+        nodo = self.__nuevo_nodo(TipoNodo.COMPARADOR, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
         self.__pasar_siguiente_componente()
         return nodo
 
@@ -688,7 +1109,7 @@ class Analizador:
         """
         self.__verificar_tipo_componente(TipoComponente.TEXTO)
 
-        nodo = NodoÁrbol(TipoNodo.TEXTO, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
+        nodo = self.__nuevo_nodo(TipoNodo.TEXTO, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
         self.__pasar_siguiente_componente()
         return nodo
 
@@ -701,7 +1122,7 @@ class Analizador:
         """
         self.__verificar_tipo_componente(TipoComponente.ENTERO)
 
-        nodo = NodoÁrbol(TipoNodo.ENTERO, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
+        nodo = self.__nuevo_nodo(TipoNodo.ENTERO, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
         self.__pasar_siguiente_componente()
         return nodo
 
@@ -714,7 +1135,7 @@ class Analizador:
         """
         self.__verificar_tipo_componente(TipoComponente.FLOTANTE)
 
-        nodo = NodoÁrbol(TipoNodo.FLOTANTE, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
+        nodo = self.__nuevo_nodo(TipoNodo.FLOTANTE, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
         self.__pasar_siguiente_componente()
         return nodo
 
@@ -728,7 +1149,7 @@ class Analizador:
         """
         self.__verificar_tipo_componente(TipoComponente.IDENTIFICADOR)
 
-        nodo = NodoÁrbol(TipoNodo.IDENTIFICADOR, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
+        nodo = self.__nuevo_nodo(TipoNodo.IDENTIFICADOR, self.componente_actual.linea, self.componente_actual.columna, contenido =self.componente_actual.texto)
         self.__pasar_siguiente_componente()
         return nodo
 
@@ -742,7 +1163,7 @@ class Analizador:
 
         if self.componente_actual.texto != texto_esperado:
             self.__reportar_error(f"se esperaba '{texto_esperado}'")
-            return
+
         self.__pasar_siguiente_componente()
 
 
@@ -753,13 +1174,7 @@ class Analizador:
         """
 
         if self.componente_actual.tipo is not tipo_esperado:
-            comp = self.componente_actual
-            print(
-                f"ERROR crítico: se esperaba un componente de tipo {tipo_esperado.name}, "
-                f"pero se encontró {comp.texto} en línea {comp.linea}, columna {comp.columna}",
-                file=sys.stderr
-            )
-            sys.exit(1)
+            self.__reportar_error(f'se esperaba un componente de tipo {tipo_esperado.name}')
 
 
 
@@ -767,15 +1182,42 @@ class Analizador:
         """
         Pasa al siguiente componente léxico
 
-        Esto revienta por ahora
+        Cuando ya no quedan el actual pasa a ser el de FIN_ARCHIVO (ver
+        __fin_archivo) y de ahí ya no se mueve.
         """
+        if self.__agotado:
+            return
+
         self.posición_componente_actual += 1
 
-        if self.posición_componente_actual >= self.cantidad_componentes:
-            return
+        siguiente = self.__sacar_componente()
+
+        if siguiente is None:
+            último = self.componente_actual
+            siguiente = self.__fin_archivo(último.linea, último.columna + len(último.texto))
+
+        self.__linea_anterior = self.componente_actual.linea
+        self.componente_actual = siguiente
+
+    def __fin_archivo(self, linea, columna):
+        """
+        Arma el componente de FIN_ARCHIVO (en la posición que se le da,
+        normalmente justo después del último componente léxico)
+        """
+        self.__agotado = True
+        return ComponenteLéxico(TipoComponente.NINGUNO, FIN_ARCHIVO, linea, columna)
 
-        self.componente_actual = \
-                self.componentes_léxicos[self.posición_componente_actual]
+
+    def __sacar_componente(self):
+        """
+        Saca el siguiente componente léxico, primero de los que ya se
+        vieron por adelantado y si no del flujo. Retorna None cuando ya no
+        quedan.
+        """
+        if self.__venideros:
+            return self.__venideros.popleft()
+
+        return next(self.__flujo, None)
 
 
     def __componente_venidero(self, avance=1):
@@ -784,4 +1226,11 @@ class Analizador:
         adelante... por default el siguiente. Esto sin adelantar el
         contador del componente actual.
         """
-        return self.componentes_léxicos[self.posición_componente_actual+avance]
+        # Solo se sacan del flujo los que hagan falta para llegar ahí
+        while len(self.__venideros) < avance:
+            componente = next(self.__flujo, None)
+            if componente is None:
+                raise IndexError('no hay más componentes léxicos')
+            self.__venideros.append(componente)
+
+        return self.__venideros[avance-1]
@@ -1,8 +1,9 @@
 # Archivo principal para el compilador
 
 from utils import archivos as utils
-from explorador.explorador import Explorador 
+from explorador.explorador import Explorador, ErrorFatal
 from analizador.analizador import Analizador 
+from analizador.analizador_solo_gramática import Validador
 from verificador.verificador import Verificador 
 from generador.generador import Generador
 
@@ -23,6 +24,11 @@ parser.add_argument('--solo-explorar', dest='explorador', action='store_true',
 parser.add_argument('--solo-analizar', dest='analizador', action='store_true', 
         help='ejecuta hasta el analizador y retorna un preorden del árbol sintáctico')
 
+parser.add_argument('--solo-validar', dest='validador', action='store_true', 
+        help='''revisa solo que el programa cumpla con la gramática, sin construir
+        el árbol sintáctico. No imprime nada si está bien; si no, los errores
+        léxicos y de sintaxis con su posición''')
+
 parser.add_argument('--solo-verificar', dest='verificador', action='store_true', 
         help='''ejecuta hasta el verificador y retorna un preorden del árbol
         sintáctico y estructuras de apoyo generadas en la verificación''')
@@ -30,58 +36,173 @@ parser.add_argument('--solo-verificar', dest='verificador', action='store_true',
 parser.add_argument('--generar-python', dest='python', action='store_true', 
         help='''Genera código python''')
 
+parser.add_argument('--flujo', dest='flujo', action='store_true', 
+        help='''el analizador va pidiendo los componentes léxicos al explorador
+        conforme los ocupa en lugar de recibir la lista completa''')
+
+parser.add_argument('--archivo-completo', dest='completo', action='store_true', 
+        help='''carga todo el archivo en memoria y lo explora de una sola pasada
+        en lugar de línea por línea''')
+
+parser.add_argument('--hilos', dest='hilos', type=int, default=1, metavar='N',
+        help='''reparte la exploración entre N procesos (no aplica con
+        --flujo)''')
+
+parser.add_argument('--hilos-verificador', dest='hilos_verificador', type=int, default=1, metavar='N',
+        help='''reparte la verificación de las funciones entre N procesos''')
+
+parser.add_argument('--afd', dest='afd', action='store_true', 
+        help='''explora con el autómata generado por explorador/generar_afd.py
+        (componente más largo posible) en lugar del regex''')
+
+parser.add_argument('--estadisticas', dest='estadisticas', action='store_true', 
+        help='''con --solo-explorar imprime en json estadísticas de la exploración
+        (intentos y aciertos por descriptor, velocidad, tiempo en blancos)''')
+
+parser.add_argument('--perfil-analizador', dest='perfil', action='store_true', 
+        help='''con --solo-analizar imprime en json, por cada producción de la
+        gramática, las llamadas, el tiempo acumulado y propio y los componentes
+        léxicos consumidos''')
+
+parser.add_argument('--asa-plano', dest='plano', action='store_true', 
+        help='''construye el árbol de sintáxis abstracta en arreglos paralelos
+        (utils/árbol_plano.py) en lugar de un objeto por nodo''')
+
 parser.add_argument('archivo',
         help='Archivo de código fuente')
 
+def cargar(args):
+    """
+    Carga el archivo de código fuente línea por línea o, con
+    --archivo-completo, en un solo string
+    """
+    if args.completo is True:
+        return utils.cargar_texto(args.archivo)
+
+    return utils.cargar_archivo(args.archivo)
+
+def explorar(texto, args):
+    """
+    Ejecuta el explorador y retorna el explorador y los componentes
+    léxicos para el analizador: la lista completa o, con --flujo, un
+    generador.
+
+    Si hubo errores léxicos los imprime y detiene el programa. Con
+    --flujo eso no se sabe hasta que el analizador se acaba el flujo, así
+    que ahí los reporta analizar
+    """
+    exp = Explorador(texto, args.afd)
+
+    if args.flujo is True:
+        return exp, exp.explorar_flujo()
+
+    exp.explorar(args.hilos)
+
+    if len(exp.errores) > 0:
+        exp.imprimir_errores()
+        sys.exit(1)
+
+    return exp, exp.componentes
+
+def analizar(exp, componentes, args):
+    """
+    Ejecuta el analizador y, si hubo errores de sintaxis (o léxicos que
+    salieron durante el análisis con --flujo), los imprime y detiene el
+    programa
+    """
+    analizador = Analizador(componentes, args.plano, args.perfil)
+    correcto = analizador.analizar()
+
+    # Los errores léxicos van primero por que son los que pueden haber
+    # causado los de sintaxis
+    if len(exp.errores) > 0:
+        analizador.errores_sintaxis = exp.errores + analizador.errores_sintaxis
+        correcto = False
+
+    if not correcto:
+        analizador.imprimir_errores()
+        if args.perfil is True:
+            analizador.imprimir_perfil()
+        sys.exit(1)
+
+    return analizador
+
+def verificar(asa, args):
+    """
+    Ejecuta el verificador y, si hubo errores, los imprime y detiene el
+    programa
+    """
+    verificador = Verificador(asa)
+
+    if not verificador.verificar(args.hilos_verificador):
+        verificador.imprimir_errores()
+        sys.exit(1)
+
+    return verificador
+
 def ciruelas():
 
     args = parser.parse_args()
 
     if args.explorador is True: 
 
-        texto = utils.cargar_archivo(args.archivo)
+        texto = cargar(args)
+
+        exp = Explorador(texto, args.afd, args.estadisticas)
+        exp.explorar(args.hilos)
+
+        if len(exp.errores) > 0:
+            exp.imprimir_errores()
+            if args.estadisticas is True:
+                exp.imprimir_estadísticas()
+            sys.exit(1)
 
-        exp = Explorador(texto)
-        exp.explorar()
         exp.imprimir_componentes()
 
+        if args.estadisticas is True:
+            exp.imprimir_estadísticas()
+
     elif args.analizador is True: 
 
-        texto = utils.cargar_archivo(args.archivo)
+        texto = cargar(args)
 
-        exp = Explorador(texto)
-        exp.explorar()
-        
-        analizador = Analizador(exp.componentes)
-        analizador.analizar()
+        analizador = analizar(*explorar(texto, args), args)
         analizador.imprimir_asa()
 
+        if args.perfil is True:
+            analizador.imprimir_perfil()
+
+    elif args.validador is True: 
+
+        texto = cargar(args)
+
+        # Siempre en flujo: los componentes se revisan conforme salen y no
+        # se guarda ninguno
+        exp = Explorador(texto, args.afd)
+        validador = Validador(exp.explorar_flujo())
+        validador.validar()
+
+        validador.errores_sintaxis = exp.errores + validador.errores_sintaxis
+        if len(validador.errores_sintaxis) > 0:
+            validador.imprimir_errores()
+            sys.exit(1)
+
     elif args.verificador is True: 
 
-        texto = utils.cargar_archivo(args.archivo)
+        texto = cargar(args)
 
-        exp = Explorador(texto)
-        exp.explorar()
-        
-        analizador = Analizador(exp.componentes)
-        analizador.analizar()
+        analizador = analizar(*explorar(texto, args), args)
 
-        verificador = Verificador(analizador.asa)
-        verificador.verificar()
+        verificador = verificar(analizador.asa, args)
         verificador.imprimir_asa()
 
     elif args.python is True:
 
-        texto = utils.cargar_archivo(args.archivo)
+        texto = cargar(args)
 
-        exp = Explorador(texto)
-        exp.explorar()
-        
-        analizador = Analizador(exp.componentes)
-        analizador.analizar()
+        analizador = analizar(*explorar(texto, args), args)
 
-        verificador = Verificador(analizador.asa)
-        verificador.verificar()
+        verificador = verificar(analizador.asa, args)
 
         generador = Generador(verificador.asa)
         
@@ -100,4 +221,10 @@ def ciruelas():
 
 
 if __name__ == '__main__':
-    ciruelas()
+    # Las fases no detienen el programa por su cuenta; los errores
+    # fatales suben hasta acá
+    try:
+        ciruelas()
+    except ErrorFatal as error:
+        print(error)
+        sys.exit(1)
@@ -0,0 +1,96 @@
+# Compilación de un programa de Ciruelas de principio a fin
+#
+# Es para usar el compilador desde otro programa (un servicio, un editor,
+# un montón de hilos compilando a la vez) en lugar de la línea de
+# comandos: ninguna fase imprime nada ni detiene el programa y todo el
+# estado de una compilación vive en su objeto Compilación, así que varias
+# pueden correr al mismo tiempo en el mismo proceso.
+
+from explorador.explorador import Explorador
+from analizador.analizador import Analizador
+from verificador.verificador import Verificador, AMBIENTE_ESTÁNDAR
+from generador.generador import Generador
+
+
+class Compilación:
+    """
+    Todo el estado de compilar un programa: el texto, las fases y lo que
+    cada una produjo.
+
+    Después de compilar():
+        - fase: la última fase que corrió ('explorador', 'analizador',
+          'verificador' o 'generador')
+        - errores: los errores de esa fase (ErrorCompilacion, o la
+          excepción si la fase reventó, por ejemplo ErrorFatal)
+        - componentes, asa y código: lo que se alcanzó a producir
+    """
+
+    def __init__(self, texto, afd=False, plano=False, ambiente=AMBIENTE_ESTÁNDAR, caché=None):
+        """
+        texto puede ser un solo string o las líneas del archivo (ver
+        utils.archivos). ambiente son las funciones nativas para el
+        verificador (ver verificador.AmbienteBase) y caché una
+        CachéVerificación de la versión anterior del mismo programa, para
+        verificar solo lo que cambió.
+        """
+        self.texto = texto
+        self.afd = afd
+        self.plano = plano
+        self.ambiente = ambiente
+        self.caché = caché
+
+        self.fase = None
+        self.errores = []
+
+        self.componentes = None
+        self.asa = None
+        self.código = None
+
+    def compilar(self, generar=True):
+        """
+        Corre las fases en orden hasta la primera que tenga errores.
+        Retorna True si se llegó al final sin errores.
+
+        Con generar=False se detiene después de verificar.
+
+        Nunca se sale con una excepción: los errores fatales, o cualquier
+        otra cosa que reviente en una fase, también quedan en
+        self.errores, y self.fase dice en cuál fue.
+        """
+        try:
+            return self.__compilar(generar)
+        except Exception as error:
+            self.errores.append(error)
+            return False
+
+    def __compilar(self, generar):
+
+        self.fase = 'explorador'
+        explorador = Explorador(self.texto, self.afd)
+        explorador.explorar()
+        self.componentes = explorador.componentes
+
+        if explorador.errores:
+            self.errores = explorador.errores
+            return False
+
+        self.fase = 'analizador'
+        analizador = Analizador(self.componentes, self.plano)
+        self.asa = analizador.asa
+
+        if not analizador.analizar():
+            self.errores = analizador.errores_sintaxis
+            return False
+
+        self.fase = 'verificador'
+        verificador = Verificador(self.asa, self.ambiente, self.caché)
+
+        if not verificador.verificar():
+            self.errores = verificador.errores
+            return False
+
+        if generar:
+            self.fase = 'generador'
+            self.código = Generador(self.asa).generar_código()
+
+        return True
@@ -1,9 +1,23 @@
 # Explorador para el lenguaje Ciruelas (scanner)
 from enum import Enum, auto
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+import json
 import sys
 
 import re
 
+from utils.archivos import lineas_texto
+
+# Tablas del autómata generadas con explorador/generar_afd.py. Si no
+# están se usa solo el regex.
+try:
+    from explorador import tablas_afd
+except ImportError:
+    tablas_afd = None
+
 class TipoComponente(Enum):
     """
     Enum con los tipos de componentes disponibles
@@ -38,8 +52,13 @@ class ComponenteLéxico:
     Clase que almacena la información de un componente léxico
 
     Almacena información auxiliar para mostrar errores (lina y columna)
+
+    Usa __slots__ para que cada instancia no cargue su propio __dict__;
+    en archivos grandes hay millones de estos.
     """
 
+    __slots__ = ('tipo', 'texto', 'linea', 'columna')
+
     tipo    : TipoComponente
     texto   : str 
     linea   : int
@@ -74,6 +93,138 @@ class ErrorCompilacion:
     def __str__(self):
         return f"ERROR: {self.mensaje} en línea {self.linea}, columna {self.columna} - Texto: '{self.texto}'"
 
+class ErrorFatal(Exception):
+    """
+    Error del que una fase no se puede recuperar (por ejemplo un nodo que
+    el visitador no sabe visitar). Las fases lo levantan en lugar de
+    detener el programa; el que las llamó decide qué hacer.
+    """
+
+def compilar_descriptores(descriptores):
+    """
+    Junta todos los descriptores de componente en un solo regex compilado.
+
+    Cada descriptor queda como una alternativa en un grupo con el nombre de
+    su tipo de componente. Las alternativas se prueban en el mismo orden
+    de la lista, así que se respetan las prioridades; el tipo se obtiene
+    del nombre del grupo que hizo match (lastgroup).
+    """
+    alternativas = []
+
+    for tipo_componente, regex in descriptores:
+        # El '^' de cada descriptor sobra porque se usa match
+        if regex.startswith('^'):
+            regex = regex[1:]
+        alternativas.append(f'(?P<{tipo_componente.name}>{regex})')
+
+    return re.compile('|'.join(alternativas))
+
+
+class ContadorDescriptores:
+    """
+    Envuelve el regex compilado de los descriptores para llevar
+    estadísticas de la exploración. Se usa en lugar de
+    Explorador.patrón_componentes solo cuando se piden estadísticas, así
+    que normalmente no cuesta nada.
+
+    El tiempo que pasa entre un match y el siguiente se le cuenta al
+    componente del primero; así entra también lo que cuesta crear el
+    componente léxico y no solo el regex.
+    """
+
+    def __init__(self, patrón, descriptores):
+        self.patrón = patrón
+        self.grupos = [tipo.name for tipo, regex in descriptores]
+
+        self.aciertos = dict.fromkeys(self.grupos, 0)
+        self.fallos = 0
+        self.caracteres = 0
+        self.bytes = 0
+
+        # Segundos por categoría: blancos y comentarios, componentes
+        # reales y caracteres desconocidos
+        self.segundos = {'ignorados': 0.0, 'componentes': 0.0, 'desconocidos': 0.0}
+
+        self.__categoría_anterior = None
+        self.__instante_anterior = None
+
+    def match(self, texto, posición=0):
+        instante = perf_counter()
+        self.__cerrar_intervalo(instante)
+
+        respuesta = self.patrón.match(texto, posición)
+
+        if respuesta is None:
+            self.fallos += 1
+            self.caracteres += 1
+            self.bytes += len(texto[posición].encode('utf-8'))
+            self.__categoría_anterior = 'desconocidos'
+
+        else:
+            grupo = respuesta.lastgroup
+            self.aciertos[grupo] += 1
+            self.caracteres += respuesta.end() - posición
+            self.bytes += len(respuesta.group().encode('utf-8'))
+
+            if grupo == 'BLANCOS' or grupo == 'COMENTARIO':
+                self.__categoría_anterior = 'ignorados'
+            else:
+                self.__categoría_anterior = 'componentes'
+
+        self.__instante_anterior = instante
+        return respuesta
+
+    def sumar_ignorados(self, texto, inicio, fin):
+        """
+        Cuenta los caracteres de blancos y comentarios que se brincaron sin
+        pasar por match (ver Explorador.procesar_texto)
+        """
+        self.caracteres += fin - inicio
+        self.bytes += len(texto[inicio:fin].encode('utf-8'))
+
+    def __cerrar_intervalo(self, instante):
+        """
+        Le cuenta el tiempo desde el match anterior a su categoría
+        """
+        if self.__categoría_anterior is not None:
+            self.segundos[self.__categoría_anterior] += instante - self.__instante_anterior
+
+    def reporte(self, cantidad_componentes):
+        """
+        Retorna las estadísticas en un diccionario (se puede pasar directo
+        a json)
+
+        Los descriptores se prueban en orden dentro del regex, así que un
+        descriptor se intentó en cada match que terminó en él o en uno
+        posterior, y en cada caracter desconocido.
+        """
+        self.__cerrar_intervalo(perf_counter())
+        self.__categoría_anterior = None
+
+        descriptores = {}
+        intentos = self.fallos
+
+        for grupo in reversed(self.grupos):
+            intentos += self.aciertos[grupo]
+            descriptores[grupo] = {'intentos': intentos, 'aciertos': self.aciertos[grupo]}
+
+        segundos = sum(self.segundos.values())
+
+        return {
+            'descriptores': {grupo: descriptores[grupo] for grupo in self.grupos},
+            'componentes': cantidad_componentes,
+            'caracteres': self.caracteres,
+            'bytes': self.bytes,
+            'caracteres_desconocidos': self.fallos,
+            'segundos': segundos,
+            'segundos_ignorados': self.segundos['ignorados'],
+            'segundos_componentes': self.segundos['componentes'],
+            'segundos_desconocidos': self.segundos['desconocidos'],
+            'bytes_por_segundo': self.bytes / segundos if segundos else 0.0,
+            'componentes_por_segundo': cantidad_componentes / segundos if segundos else 0.0,
+        }
+
+
 class Explorador:
     """
     Clase que lleva el proceso principal de exploración y deja listos los 
@@ -99,7 +250,7 @@ class Explorador:
             (TipoComponente.ASIGNACION, r'^(metale)'),
             (TipoComponente.OPERADOR, r'^(echele|quitele|chuncherequee|desmadeje|divorcio|casorio)'),
             (TipoComponente.COMPARADOR, r'^(cañazo|poquitico|misma vara|otra vara|menos o igualitico|más o igualitico)'),
-            (TipoComponente.TEXTO, r'^(~.?[^~]*)~'),
+            (TipoComponente.TEXTO, r'^(~.?[^~\n]*)~'), # Sin saltos de línea para el modo de archivo completo
             (TipoComponente.IDENTIFICADOR, r'^([a-záéíóúüñ_]([a-záéíóúüñA-ZÁÉÍÓÚÑ0-9_])*)'),
             (TipoComponente.FLOTANTE, r'^(-?[0-9]+\.[0-9]+)'), # Detectar los flotantes antes para que no se confundan con enteros
             (TipoComponente.ENTERO, r'^(-?[0-9]+)'),
@@ -107,8 +258,44 @@ class Explorador:
             (TipoComponente.PUNTUACION, r'^([/{}()])'),
             (TipoComponente.BLANCOS, r'^(\s+)')]
 
-    def __init__(self, contenido_archivo):
+    # Todos los descriptores compilados en un solo regex (ver
+    # compilar_descriptores)
+    patrón_componentes = compilar_descriptores(descriptores_componentes)
+
+    # Tipo de componente según el nombre del grupo que hizo match
+    tipos_por_grupo = {tipo.name: tipo for tipo, regex in descriptores_componentes}
+
+    # Los textos de los identificadores y palabras clave se internan
+    # (sys.intern) para que todas sus apariciones sean el mismo string y
+    # las comparaciones de las otras fases casi siempre se resuelvan por
+    # identidad. Los literales no, casi nunca se repiten (van por nombre
+    # de grupo porque el hash de un Enum es lento)
+    grupos_literales = frozenset(['TEXTO', 'ENTERO', 'FLOTANTE'])
+    tipos_literales = frozenset([TipoComponente.TEXTO, TipoComponente.ENTERO, TipoComponente.FLOTANTE])
+
+    # Una corrida seguida de blancos y comentarios, que en el modo de
+    # archivo completo se brinca con un solo match
+    patrón_ignorados = re.compile(r'(?:\s+|Bomba:.*)+')
+
+    # Las tablas del autómata solo sirven si se generaron con los
+    # descriptores actuales
+    afd_vigente = tablas_afd is not None and \
+            tablas_afd.FIRMA == tuple(regex for tipo, regex in descriptores_componentes)
+
+    def __init__(self, contenido_archivo, afd=False, estadísticas=False):
         self.texto = contenido_archivo
+
+        # Con afd se explora con el autómata (componente más largo posible)
+        # en lugar del regex, si las tablas están al día
+        self.afd = afd and self.afd_vigente
+
+        # Con estadísticas el regex se cambia (solo en esta instancia) por
+        # uno que va contando. Las estadísticas son solo del regex, no del
+        # autómata ni de la exploración en paralelo.
+        self.contador = None
+        if estadísticas:
+            self.contador = ContadorDescriptores(self.patrón_componentes, self.descriptores_componentes)
+            self.patrón_componentes = self.contador
         self.componentes = []
 
         # Lista de errores encontrados
@@ -117,23 +304,175 @@ class Explorador:
         # Se asegura que regex funcione en modo unicode para soportar caracteres especiales
         re.UNICODE
 
-    def explorar(self):
+    def explorar(self, hilos=1):
         """
         Itera sobre cada una de las líneas y las va procesando de forma que
         se generan los componentes lexicos necesarios en la etapa de
         análisis
+
+        Si el contenido del archivo es un solo string (ver
+        utils.archivos.cargar_texto) se explora todo de una sola pasada en
+        lugar de línea por línea.
+
+        Con hilos mayor a 1 las líneas se reparten en pedazos entre varios
+        procesos (ver explorar_paralelo)
+
+        Los errores no detienen nada: quedan en self.errores y el que
+        llamó decide qué hacer con ellos (ciruelas.py los imprime y
+        termina).
+        """
+        if hilos > 1:
+            self.explorar_paralelo(hilos)
+
+        elif isinstance(self.texto, str) and not self.afd:
+            self.componentes = self.procesar_texto(self.texto)
+
+        else:
+            indice_linea = 1
+
+            # El autómata trabaja línea por línea
+            lineas = self.texto
+            if isinstance(lineas, str):
+                lineas = lineas_texto(lineas)
+
+            for linea in lineas:
+                resultado = self.procesar_linea(linea, indice_linea)
+                # extend agrega en el mismo lugar, sin copiar toda la lista
+                self.componentes.extend(resultado)
+                indice_linea += 1
+
+    def estadísticas(self):
+        """
+        Retorna las estadísticas de la exploración (ver
+        ContadorDescriptores.reporte) o None si no se pidieron
+        """
+        if self.contador is None:
+            return None
+
+        return self.contador.reporte(len(self.componentes))
+
+    def imprimir_estadísticas(self):
+        """
+        Imprime las estadísticas de la exploración en json
+        """
+        print(json.dumps(self.estadísticas(), ensure_ascii=False, indent=4))
+
+    def explorar_paralelo(self, hilos):
+        """
+        Reparte las líneas en pedazos seguidos y los explora en un grupo de
+        procesos. Esto se puede porque ningún componente léxico pasa de una
+        línea a otra.
+
+        Los resultados se juntan en orden, así que los componentes y los
+        errores quedan igual que explorando en un solo proceso. Los
+        textos que no son literales se vuelven a internar acá, por que
+        llegan del otro proceso como strings nuevos.
+        """
+        if isinstance(self.texto, str):
+            lineas = list(lineas_texto(self.texto))
+        else:
+            lineas = list(self.texto)
+
+        # Varios pedazos por proceso para que se repartan parejo
+        tamaño_pedazo = max(1, -(-len(lineas) // (hilos * 4)))
+        inicios = range(0, len(lineas), tamaño_pedazo)
+        pedazos = [lineas[inicio:inicio + tamaño_pedazo] for inicio in inicios]
+        primeras_lineas = [inicio + 1 for inicio in inicios]
+
+        with ProcessPoolExecutor(max_workers=hilos) as grupo:
+            for componentes, errores in grupo.map(explorar_pedazo, pedazos,
+                    primeras_lineas, [self.afd] * len(pedazos)):
+
+                for componente in componentes:
+                    if componente.tipo not in self.tipos_literales:
+                        componente.texto = sys.intern(componente.texto)
+
+                self.componentes.extend(componentes)
+                self.errores.extend(errores)
+
+    def re_explorar(self, cambios):
+        """
+        Actualiza los componentes léxicos y los errores de una exploración
+        anterior después de editar algunas líneas, sin volver a explorar
+        todo el archivo.
+
+        cambios es una lista de tuplas (primera_linea, última_linea,
+        lineas_nuevas): las líneas de primera_linea a última_linea
+        (inclusive, con la numeración de antes de editar) se cambian por
+        las de lineas_nuevas. Si última_linea es menor que primera_linea
+        las líneas nuevas solo se insertan antes de primera_linea.
+
+        Solo se exploran las líneas nuevas; a los componentes que quedan
+        después se les corre el número de línea si cambió la cantidad de
+        líneas. No detiene el programa si hay errores, esos quedan en
+        self.errores.
+        """
+
+        # De abajo hacia arriba para que los números de línea de los
+        # cambios que faltan sigan siendo válidos
+        for primera_linea, última_linea, lineas_nuevas in \
+                sorted(cambios, key=lambda cambio: cambio[0], reverse=True):
+
+            # procesar_linea registra los errores en self.errores, así que
+            # mientras tanto se apartan los anteriores
+            errores_anteriores = self.errores
+            self.errores = []
+
+            nuevos_componentes = []
+            for indice_linea, linea in enumerate(lineas_nuevas, primera_linea):
+                nuevos_componentes.extend(self.procesar_linea(linea, indice_linea))
+
+            nuevos_errores = self.errores
+            self.errores = errores_anteriores
+
+            lineas_borradas = max(última_linea - primera_linea + 1, 0)
+            desplazamiento = len(lineas_nuevas) - lineas_borradas
+
+            self.__reemplazar_lineas(self.componentes, primera_linea,
+                    última_linea, nuevos_componentes, desplazamiento)
+            self.__reemplazar_lineas(self.errores, primera_linea,
+                    última_linea, nuevos_errores, desplazamiento)
+
+    def __reemplazar_lineas(self, elementos, primera_linea, última_linea, nuevos, desplazamiento):
+        """
+        Cambia los elementos (componentes o errores, ordenados por línea)
+        de un rango de líneas por los nuevos y corre las líneas de los que
+        vienen después
         """
-        indice_linea = 1
+        inicio = bisect_left(elementos, primera_linea, key=lambda elemento: elemento.linea)
+        fin = bisect_right(elementos, última_linea, lo=inicio, key=lambda elemento: elemento.linea)
 
-        for linea in self.texto:
-            resultado = self.procesar_linea(linea, indice_linea)
-            self.componentes = self.componentes + resultado
-            indice_linea += 1
+        elementos[inicio:fin] = nuevos
 
-        # Si se encontró 1 o más errores se imprimen y se detiene el programa
-        if len(self.errores) > 0:
-            self.imprimir_errores()
-            sys.exit()
+        if desplazamiento != 0:
+            for posición in range(inicio + len(nuevos), len(elementos)):
+                elementos[posición].linea += desplazamiento
+
+    def explorar_flujo(self):
+        """
+        Igual que explorar, pero en lugar de guardar los componentes
+        léxicos los va generando conforme salen de cada línea. Así el
+        Analizador puede empezar antes de que se termine de explorar y
+        nunca se tiene la lista completa en memoria.
+
+        Los errores quedan en self.errores igual que con explorar, pero
+        están completos hasta que se agota el flujo.
+        """
+        # Si ya se tiene todo el texto en memoria no se gana nada yendo
+        # línea por línea
+        if isinstance(self.texto, str) and not self.afd:
+            yield from self.procesar_texto(self.texto)
+
+        else:
+            indice_linea = 1
+
+            lineas = self.texto
+            if isinstance(lineas, str):
+                lineas = lineas_texto(lineas)
+
+            for linea in lineas:
+                yield from self.procesar_linea(linea, indice_linea)
+                indice_linea += 1
 
     def imprimir_componentes(self):
         """
@@ -161,6 +500,78 @@ class Explorador:
         error = ErrorCompilacion(mensaje, texto, linea, columna)
         self.errores.append(error)
 
+    def procesar_texto(self, texto):
+        """
+        Extrae los componentes léxicos de todo el texto de una sola vez.
+
+        La línea y la columna solo se calculan cuando se crea un componente
+        o un error: la línea se busca (bisect) en la tabla con la posición
+        donde inicia cada línea y la columna sale de la distancia al inicio
+        de la línea más los tabuladores de los blancos (que valen 4).
+        """
+
+        componentes = []
+
+        # Posición donde inicia cada línea (la primera es la línea 1)
+        # (en un array para no tener un objeto int por línea)
+        inicios_linea = array('q', [0])
+        inicios_linea.extend(salto.end() for salto in re.finditer('\n', texto))
+
+        # Columnas de más que suman los tabuladores en la línea actual
+        extra_tabuladores = 0
+
+        posición = 0
+        largo_texto = len(texto)
+
+        while(posición < largo_texto):
+
+            respuesta = self.patrón_componentes.match(texto, posición)
+
+            # Si no hubo match con nada
+            if respuesta is None:
+                indice_linea = bisect_right(inicios_linea, posición)
+                indice_columna = posición - inicios_linea[indice_linea-1] + 1 + extra_tabuladores
+                self.registrar_error("Caracter desconocido", texto[posición], indice_linea, indice_columna)
+
+                # Se avanza un caracter para continuar la exploración
+                posición += 1
+                continue
+
+            grupo = respuesta.lastgroup
+
+            # Los blancos y comentarios se brincan todos de un solo golpe.
+            # Son los únicos que pueden traer saltos de línea y ahí se
+            # vuelve a empezar a contar tabuladores (un comentario llega
+            # hasta el final de la línea, así que sus tabuladores nunca
+            # afectan a un componente)
+            if grupo == 'BLANCOS' or grupo == 'COMENTARIO':
+                fin = self.patrón_ignorados.match(texto, posición).end()
+                if self.contador is not None:
+                    self.contador.sumar_ignorados(texto, respuesta.end(), fin)
+                salto = texto.rfind('\n', posición, fin)
+                if salto == -1:
+                    extra_tabuladores += 3 * texto.count('\t', posición, fin)
+                else:
+                    extra_tabuladores = 3 * texto.count('\t', salto, fin)
+
+                posición = fin
+                continue
+
+            texto_coindicencia = respuesta.group()
+
+            indice_linea = bisect_right(inicios_linea, posición)
+            indice_columna = posición - inicios_linea[indice_linea-1] + 1 + extra_tabuladores
+
+            if grupo not in self.grupos_literales:
+                texto_coindicencia = sys.intern(texto_coindicencia)
+
+            nuevo_componente = ComponenteLéxico(self.tipos_por_grupo[grupo], texto_coindicencia, indice_linea, indice_columna)
+            componentes.append(nuevo_componente)
+
+            posición = respuesta.end()
+
+        return componentes
+
     def procesar_linea(self, linea, indice_linea):
         """
         Toma cada línea y la procesa extrayendo los componentes léxicos.
@@ -169,64 +580,149 @@ class Explorador:
         adicional necesaria para tener errores inteligentes
         """
 
+        if self.afd:
+            return self.procesar_linea_afd(linea, indice_linea)
+
         componentes = []
         indice_columna = 1
 
-        # Toma una línea y le va cortando pedazos hasta que se acaba
-        while(linea !=  ""):
+        # Posición dentro de la línea; se avanza sobre el texto original en
+        # lugar de irle cortando pedazos
+        posición = 0
+        largo_linea = len(linea)
+
+        while(posición < largo_linea):
+
+            # Un solo intento de match contra todos los descriptores; el
+            # nombre del grupo que hizo match dice el tipo de componente
+            respuesta = self.patrón_componentes.match(linea, posición)
+
+            # Si no hubo match con nada
+            if respuesta is None:
+                caracter_desconocido = linea[posición]
+                self.registrar_error("Caracter desconocido", caracter_desconocido, indice_linea, indice_columna)
+
+                # Se avanza un caracter para continuar la exploración
+                posición += 1
+                indice_columna += 1
+                continue
+
+            tipo_componente = self.tipos_por_grupo[respuesta.lastgroup]
+            texto_coindicencia = respuesta.group()
+            # Se actualiza el índice de la columna que corresponde al componente
+            indice_columna_componente = indice_columna
+            # Para los espacios en blanco, se cuentan los caracteres individualmente
+            if tipo_componente is TipoComponente.BLANCOS:
+                for caracter in texto_coindicencia:
+                    # En el caso de los tabuladores se asume que equivalen a 4 espacios
+                    if caracter == '\t':
+                        indice_columna += 4
+                    else:
+                        indice_columna += 1
+            else:
+                indice_columna += len(texto_coindicencia)
 
-            # Bandera para saber si hubo match o no
-            match_encontrado = False
+            # si la coincidencia corresponde a un BLANCO o un
+            # COMENTARIO se ignora por que no se ocupa
+            if tipo_componente is not TipoComponente.BLANCOS and \
+                    tipo_componente is not TipoComponente.COMENTARIO:
 
-            # Separa los descriptores de componente en dos variables
-            for tipo_componente, regex in self.descriptores_componentes:
+                if respuesta.lastgroup not in self.grupos_literales:
+                    texto_coindicencia = sys.intern(texto_coindicencia)
 
+                #Crea el componente léxico y lo guarda
+                nuevo_componente = ComponenteLéxico(tipo_componente, texto_coindicencia, indice_linea, indice_columna_componente) 
+                componentes.append(nuevo_componente)
 
-                # Trata de hacer match con el descriptor actual
-                respuesta = re.match(regex, linea)
+            # Se brinca el pedazo que hizo match
+            posición = respuesta.end()
 
-                # Si no es nulo significa que hubo coincidencia
-                match_encontrado = respuesta is not None
+        return componentes
 
-                # Si hay coincidencia se procede a generar el componente
-                # léxico final
-                if match_encontrado:
-                    texto_coindicencia = respuesta.group()
-                    # Se actualiza el índice de la columna que corresponde al componente
-                    indice_columna_componente = indice_columna
-                    # Para los espacios en blanco, se cuentan los caracteres individualmente
-                    if tipo_componente is TipoComponente.BLANCOS:
-                        for caracter in texto_coindicencia:
-                            # En el caso de los tabuladores se asume que equivalen a 4 espacios
-                            if caracter == '\t':
-                                indice_columna += 4
-                            else:
-                                indice_columna += 1
-                    else:
-                        indice_columna += len(texto_coindicencia)
+    def procesar_linea_afd(self, linea, indice_linea):
+        """
+        Igual que procesar_linea pero recorriendo el autómata de
+        tablas_afd caracter por caracter. Cada componente es el más largo
+        posible y si dos descriptores aceptan el mismo texto gana el que
+        esté primero en descriptores_componentes. Así 'maestro' es un
+        IDENTIFICADOR y no 'mae' seguido de 'stro'.
+        """
+
+        transiciones = tablas_afd.TRANSICIONES
+        aceptación = tablas_afd.ACEPTACIÓN
+        clases = tablas_afd.CLASES
+        cantidad_clases = tablas_afd.CANTIDAD_CLASES
 
-                    # si la coincidencia corresponde a un BLANCO o un
-                    # COMENTARIO se ignora por que no se ocupa
-                    if tipo_componente is not TipoComponente.BLANCOS and \
-                            tipo_componente is not TipoComponente.COMENTARIO:
+        componentes = []
+        indice_columna = 1
+
+        posición = 0
+        largo_linea = len(linea)
+
+        while(posición < largo_linea):
+
+            # Se avanza mientras haya transición y se recuerda el último
+            # estado que aceptaba
+            estado = 0
+            descriptor = -1
+            fin = siguiente = posición
 
-                        #Crea el componente léxico y lo guarda
-                        nuevo_componente = ComponenteLéxico(tipo_componente, respuesta.group(), indice_linea, indice_columna_componente) 
-                        componentes.append(nuevo_componente)
+            while siguiente < largo_linea:
+                estado = transiciones[estado * cantidad_clases + clases.get(linea[siguiente], 0)]
+                if estado < 0:
+                    break
 
+                siguiente += 1
+                if aceptación[estado] >= 0:
+                    descriptor = aceptación[estado]
+                    fin = siguiente
 
-                    # Se elimina el pedazo que hizo match
-                    linea = linea[respuesta.end():]
-                    break;
-            
             # Si no hubo match con nada
-            if not match_encontrado:
-                caracter_desconocido = linea[0]
-                self.registrar_error("Caracter desconocido", caracter_desconocido, indice_linea, indice_columna)
+            if descriptor < 0:
+                self.registrar_error("Caracter desconocido", linea[posición], indice_linea, indice_columna)
 
                 # Se avanza un caracter para continuar la exploración
-                linea = linea[1:]
+                posición += 1
                 indice_columna += 1
+                continue
+
+            tipo_componente = self.descriptores_componentes[descriptor][0]
+            texto_coindicencia = linea[posición:fin]
+            indice_columna_componente = indice_columna
+
+            if tipo_componente is TipoComponente.BLANCOS:
+                # Los tabuladores valen 4 espacios
+                indice_columna += len(texto_coindicencia) + 3 * texto_coindicencia.count('\t')
+            else:
+                indice_columna += len(texto_coindicencia)
+
+            if tipo_componente is not TipoComponente.BLANCOS and \
+                    tipo_componente is not TipoComponente.COMENTARIO:
+
+                if tipo_componente.name not in self.grupos_literales:
+                    texto_coindicencia = sys.intern(texto_coindicencia)
+
+                nuevo_componente = ComponenteLéxico(tipo_componente, texto_coindicencia, indice_linea, indice_columna_componente)
+                componentes.append(nuevo_componente)
+
+            posición = fin
 
         return componentes
 
+
+def explorar_pedazo(lineas, primera_linea, afd=False):
+    """
+    Explora un pedazo de líneas en un proceso aparte (ver
+    Explorador.explorar_paralelo). Tiene que estar a nivel de módulo para
+    que se pueda mandar al otro proceso.
+
+    Retorna los componentes léxicos y los errores con los números de
+    línea absolutos.
+    """
+    explorador = Explorador(lineas, afd)
+    componentes = []
+
+    for indice_linea, linea in enumerate(lineas, primera_linea):
+        componentes.extend(explorador.procesar_linea(linea, indice_linea))
+
+    return componentes, explorador.errores
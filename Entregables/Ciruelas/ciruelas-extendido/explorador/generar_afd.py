@@ -0,0 +1,312 @@
+# Generador del autómata finito determinista (AFD) del explorador
+#
+# Convierte los descriptores de componente del Explorador en las tablas de
+# un AFD y las escribe en explorador/tablas_afd.py. Se corre desde la raíz
+# del proyecto cada vez que se cambien los descriptores:
+#
+#   python3 -m explorador.generar_afd
+
+import os
+import re
+import sys
+
+try:
+    import re._parser as sre_parse
+    from re._constants import (LITERAL, NOT_LITERAL, ANY, IN, RANGE, NEGATE,
+            CATEGORY, CATEGORY_SPACE, CATEGORY_NOT_SPACE, SUBPATTERN, BRANCH,
+            MAX_REPEAT, MIN_REPEAT, MAXREPEAT, AT, AT_BEGINNING)
+except ImportError: # python < 3.11
+    import sre_parse
+    from sre_constants import (LITERAL, NOT_LITERAL, ANY, IN, RANGE, NEGATE,
+            CATEGORY, CATEGORY_SPACE, CATEGORY_NOT_SPACE, SUBPATTERN, BRANCH,
+            MAX_REPEAT, MIN_REPEAT, MAXREPEAT, AT, AT_BEGINNING)
+
+from explorador.explorador import Explorador
+
+
+# Todos los caracteres que python considera blancos (\s)
+BLANCOS = frozenset(chr(código) for código in range(sys.maxunicode + 1)
+        if re.match(r'\s', chr(código)))
+
+
+class AFN:
+    """
+    Autómata finito no determinista construido a la Thompson a partir del
+    árbol que genera el parser de regex de python.
+
+    Las transiciones con caracter se guardan con una etiqueta (la parte
+    del regex que describe qué caracteres acepta) en lugar de un caracter
+    para no tener que enumerar todo unicode.
+    """
+
+    def __init__(self):
+        self.vacías = []     # estado -> estados a los que llega sin consumir nada
+        self.caracteres = [] # estado -> [(etiqueta, estado)]
+        self.etiquetas = []
+        self.aceptación = {} # estado final -> número del descriptor
+
+    def nuevo_estado(self):
+        self.vacías.append([])
+        self.caracteres.append([])
+        return len(self.vacías) - 1
+
+    def agregar_etiqueta(self, etiqueta):
+        if etiqueta not in self.etiquetas:
+            self.etiquetas.append(etiqueta)
+        return self.etiquetas.index(etiqueta)
+
+    def construir(self, nodos, inicio):
+        """
+        Agrega los estados para una secuencia de nodos del regex a partir
+        del estado inicio y retorna el estado donde termina
+        """
+        actual = inicio
+
+        for operación, argumento in nodos:
+
+            if operación in (LITERAL, NOT_LITERAL, ANY, IN):
+                siguiente = self.nuevo_estado()
+                etiqueta = (operación, tuple(argumento) if operación is IN else argumento)
+                self.caracteres[actual].append((self.agregar_etiqueta(etiqueta), siguiente))
+                actual = siguiente
+
+            elif operación is SUBPATTERN:
+                actual = self.construir(argumento[-1], actual)
+
+            elif operación is BRANCH:
+                fin = self.nuevo_estado()
+                for alternativa in argumento[1]:
+                    self.vacías[self.construir(alternativa, actual)].append(fin)
+                actual = fin
+
+            elif operación in (MAX_REPEAT, MIN_REPEAT):
+                mínimo, máximo, repetido = argumento
+
+                for _ in range(mínimo):
+                    actual = self.construir(repetido, actual)
+
+                if máximo == MAXREPEAT:
+                    ciclo = self.nuevo_estado()
+                    self.vacías[actual].append(ciclo)
+                    self.vacías[self.construir(repetido, ciclo)].append(ciclo)
+                    actual = ciclo
+                else:
+                    fin = self.nuevo_estado()
+                    for _ in range(máximo - mínimo):
+                        self.vacías[actual].append(fin)
+                        actual = self.construir(repetido, actual)
+                    self.vacías[actual].append(fin)
+                    actual = fin
+
+            elif operación is AT and argumento is AT_BEGINNING:
+                # El '^' no hace nada porque siempre se empieza en la
+                # posición actual
+                pass
+
+            else:
+                raise ValueError(f'el AFD no soporta {operación} en los descriptores')
+
+        return actual
+
+    def cerradura(self, estados):
+        """
+        Todos los estados a los que se llega desde estados sin consumir
+        caracteres
+        """
+        pendientes = list(estados)
+        resultado = set(estados)
+
+        while pendientes:
+            for siguiente in self.vacías[pendientes.pop()]:
+                if siguiente not in resultado:
+                    resultado.add(siguiente)
+                    pendientes.append(siguiente)
+
+        return frozenset(resultado)
+
+
+def coincide(etiqueta, caracter):
+    """
+    Dice si un caracter cumple con la etiqueta de una transición
+    """
+    operación, argumento = etiqueta
+    código = ord(caracter)
+
+    if operación is LITERAL:
+        return código == argumento
+
+    if operación is NOT_LITERAL:
+        return código != argumento
+
+    if operación is ANY:
+        return caracter != '\n'
+
+    # IN
+    negado = False
+    resultado = False
+
+    for tipo, valor in argumento:
+        if tipo is NEGATE:
+            negado = True
+        elif tipo is LITERAL:
+            resultado = resultado or código == valor
+        elif tipo is RANGE:
+            resultado = resultado or valor[0] <= código <= valor[1]
+        elif tipo is CATEGORY and valor is CATEGORY_SPACE:
+            resultado = resultado or caracter in BLANCOS
+        elif tipo is CATEGORY and valor is CATEGORY_NOT_SPACE:
+            resultado = resultado or caracter not in BLANCOS
+        else:
+            raise ValueError(f'el AFD no soporta {tipo} {valor} en los descriptores')
+
+    return resultado != negado
+
+
+def caracteres_mencionados(etiquetas):
+    """
+    Los caracteres que aparecen explícitamente en alguna etiqueta. Todos
+    los demás caracteres se comportan igual en todas las transiciones.
+    """
+    caracteres = set(BLANCOS) | {'\n'}
+
+    for operación, argumento in etiquetas:
+        if operación in (LITERAL, NOT_LITERAL):
+            caracteres.add(chr(argumento))
+
+        elif operación is IN:
+            for tipo, valor in argumento:
+                if tipo is LITERAL:
+                    caracteres.add(chr(valor))
+                elif tipo is RANGE:
+                    caracteres.update(map(chr, range(valor[0], valor[1] + 1)))
+
+    return caracteres
+
+
+def generar_afd(descriptores):
+    """
+    Construye el AFD para los descriptores.
+
+    Retorna (clases, cantidad_clases, transiciones, aceptación):
+        - clases: caracter -> número de clase (los que no aparecen son de
+          la clase 0)
+        - transiciones: lista plana estado * cantidad_clases + clase ->
+          estado siguiente o -1
+        - aceptación: estado -> número del descriptor que acepta o -1
+    """
+    afn = AFN()
+    inicio = afn.nuevo_estado()
+
+    for número, (tipo, regex) in enumerate(descriptores):
+        inicio_descriptor = afn.nuevo_estado()
+        afn.vacías[inicio].append(inicio_descriptor)
+        fin = afn.construir(sre_parse.parse(regex).data, inicio_descriptor)
+        afn.aceptación[fin] = número
+
+    # Se agrupan los caracteres que cumplen exactamente las mismas
+    # etiquetas; esas son las clases de caracter del AFD
+    mencionados = caracteres_mencionados(afn.etiquetas)
+    otro = next(chr(código) for código in range(0x4e00, sys.maxunicode)
+            if chr(código) not in mencionados)
+
+    def firma(caracter):
+        return tuple(coincide(etiqueta, caracter) for etiqueta in afn.etiquetas)
+
+    firmas = {firma(otro): 0}
+    clases = {}
+
+    for caracter in sorted(mencionados):
+        clase = firmas.setdefault(firma(caracter), len(firmas))
+        if clase != 0:
+            clases[caracter] = clase
+
+    cantidad_clases = len(firmas)
+
+    # Etiqueta -> clases que la cumplen
+    clases_etiqueta = [{clase for f, clase in firmas.items() if f[número]}
+            for número in range(len(afn.etiquetas))]
+
+    # Construcción por subconjuntos
+    estado_inicial = afn.cerradura([inicio])
+    estados = {estado_inicial: 0}
+    pendientes = [estado_inicial]
+    transiciones = []
+    aceptación = []
+
+    while pendientes:
+        conjunto = pendientes.pop(0)
+
+        aceptados = [afn.aceptación[estado] for estado in conjunto if estado in afn.aceptación]
+        aceptación.append(min(aceptados) if aceptados else -1)
+
+        for clase in range(cantidad_clases):
+            destinos = [destino for estado in conjunto
+                    for etiqueta, destino in afn.caracteres[estado]
+                    if clase in clases_etiqueta[etiqueta]]
+
+            if not destinos:
+                transiciones.append(-1)
+                continue
+
+            siguiente = afn.cerradura(destinos)
+            if siguiente not in estados:
+                estados[siguiente] = len(estados)
+                pendientes.append(siguiente)
+
+            transiciones.append(estados[siguiente])
+
+    return clases, cantidad_clases, transiciones, aceptación
+
+
+def escribir_tablas(ruta_archivo):
+    """
+    Genera el AFD para los descriptores del Explorador y lo escribe como
+    un módulo de python
+    """
+    descriptores = Explorador.descriptores_componentes
+    clases, cantidad_clases, transiciones, aceptación = generar_afd(descriptores)
+
+    def en_filas(números, por_fila):
+        filas = []
+        for inicio in range(0, len(números), por_fila):
+            filas.append('    ' + ', '.join(map(str, números[inicio:inicio + por_fila])) + ',')
+        return '\n'.join(filas)
+
+    with open(ruta_archivo, 'w', encoding='utf-8') as archivo:
+        archivo.write('# Tablas del AFD del explorador\n')
+        archivo.write('#\n')
+        archivo.write('# Archivo generado con: python3 -m explorador.generar_afd\n')
+        archivo.write('# No se edita a mano\n\n')
+        archivo.write('from array import array\n\n')
+
+        archivo.write('# Descriptores con que se generaron las tablas\n')
+        archivo.write('FIRMA = (\n')
+        for tipo, regex in descriptores:
+            archivo.write(f'    {regex!r},\n')
+        archivo.write(')\n\n')
+
+        archivo.write('# Clase de cada caracter; los que no están son de la clase 0\n')
+        archivo.write('CLASES = {\n')
+        for caracter, clase in sorted(clases.items()):
+            archivo.write(f'    {caracter!r}: {clase},\n')
+        archivo.write('}\n\n')
+
+        archivo.write(f'CANTIDAD_CLASES = {cantidad_clases}\n\n')
+
+        archivo.write('# Estado siguiente en la posición estado * CANTIDAD_CLASES + clase (-1 si no hay)\n')
+        archivo.write("TRANSICIONES = array('h', [\n")
+        archivo.write(en_filas(transiciones, cantidad_clases))
+        archivo.write('\n])\n\n')
+
+        archivo.write('# Número del descriptor que acepta cada estado (-1 si no acepta)\n')
+        archivo.write("ACEPTACIÓN = array('b', [\n")
+        archivo.write(en_filas(aceptación, 20))
+        archivo.write('\n])\n')
+
+    return len(aceptación), cantidad_clases
+
+
+if __name__ == '__main__':
+    ruta = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tablas_afd.py')
+    cantidad_estados, cantidad_clases = escribir_tablas(ruta)
+    print(f"AFD con {cantidad_estados} estados y {cantidad_clases} clases de caracter escrito en '{ruta}'")
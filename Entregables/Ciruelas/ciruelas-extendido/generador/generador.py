@@ -52,6 +52,13 @@ def déjelo_parejo(flotante):
         else:
             self.asa.imprimir_preorden()
 
+    def generar_código(self):
+        """
+        Retorna el código Python completo (con el ambiente estándar) sin
+        escribirlo a ningún lado
+        """
+        return self.ambiente_estandar + "\n" + self.visitador.visitar(self.asa.raiz)
+
     def generar(self, nombre_archivo, directorio="transpilados"):
         """
         Genera el código Python y lo guarda en un archivo .py dentro de un directorio
@@ -60,8 +67,7 @@ def déjelo_parejo(flotante):
             nombre_archivo (str): Nombre del archivo a crear (por defecto: "programa_generado.py")
             directorio (str): Directorio donde crear el archivo (por defecto: "transpilados")
         """
-        resultado = self.visitador.visitar(self.asa.raiz)
-        codigo_completo = self.ambiente_estandar + "\n" + resultado
+        codigo_completo = self.generar_código()
         
         try:
             # Crear el directorio si no existe
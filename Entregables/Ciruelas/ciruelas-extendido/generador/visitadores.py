@@ -1,12 +1,52 @@
 # Implementa el veficador de ciruelas
-import sys
 from utils.árbol import ÁrbolSintáxisAbstracta, NodoÁrbol, TipoNodo
+from utils import pila
+from explorador.explorador import ErrorFatal
 
 class VisitantePython:
 
-    tabuladores = 0
+    tabuladores : int
+
+    # Traducción directa de operadores y comparadores a python
+    operadores = {
+            'echele'        : '+',
+            'quitele'       : '-',
+            'chuncherequee' : '*',
+            'desmadeje'     : '/',
+            }
+
+    operadores_lógicos = {
+            'divorcio' : 'or',
+            'casorio'  : 'and',
+            }
+
+    comparadores = {
+            'cañazo'             : '>',
+            'poquitico'          : '<',
+            'misma vara'         : '==',
+            'otra vara'          : '!=',
+            'menos o igualitico' : '<=',
+            'más o igualitico'   : '>=',
+            }
+
+    def __init__(self):
+
+        self.tabuladores = 0
+
+        # TipoNodo -> método que lo visita
+        self.__métodos = {}
 
     def visitar(self, nodo :TipoNodo):
+        """
+        Genera el código de nodo y de todo su subárbol.
+
+        Igual que en el verificador, cada __visitar_* hace yield de los
+        hijos en lugar de visitarlos directamente y pila.ejecutar los va
+        resolviendo sin recursión.
+        """
+        return pila.ejecutar(self.__despachar(nodo), self.__despachar)
+
+    def __despachar(self, nodo):
         """
         Realiza el despacho dinámico para procesar un nodo del árbol.
 
@@ -14,17 +54,23 @@ class VisitantePython:
             nodo (NodoÁrbol): El nodo AST que se va a visitar.
 
         Retorna:
-            El resultado de invocar el método específico para el tipo de nodo.
+            El resultado de invocar el método específico para el tipo de nodo
+            (un generador si el método visita otros nodos).
 
-        Imprime el error y detiene el programa: 
+        Levanta ErrorFatal: 
             Si no existe un método asociado al tipo de nodo.
         """
-        # Construye nombre del método a partir del tipo de nodo
-        method_name = f"_VisitantePython__visitar_{nodo.tipo.name.lower()}"
-        method = getattr(self, method_name, None)
+        method = self.__métodos.get(nodo.tipo)
+
         if method is None:
-            print(f"FATAL: no existe un método para visitar nodo de tipo {nodo.tipo} en línea {nodo.linea} columna {nodo.columna}")
-            sys.exit(1)
+            # Construye nombre del método a partir del tipo de nodo (una
+            # sola vez por tipo)
+            method_name = f"_VisitantePython__visitar_{nodo.tipo.name.lower()}"
+            method = getattr(self, method_name, None)
+            if method is None:
+                raise ErrorFatal(f"FATAL: no existe un método para visitar nodo de tipo {nodo.tipo} en línea {nodo.linea} columna {nodo.columna}")
+            self.__métodos[nodo.tipo] = method
+
         return method(nodo)
 
     def __visitar_programa(self, nodo_actual):
@@ -36,7 +82,7 @@ class VisitantePython:
         # Se ignoran los comentarios
 
         for nodo in nodo_actual.nodos:
-            instrucciones.append(nodo.visitar(self))
+            instrucciones.append((yield nodo))
 
         return '\n'.join(instrucciones) 
 
@@ -50,7 +96,7 @@ class VisitantePython:
         instrucciones = []
 
         for nodo in nodo_actual.nodos:
-            instrucciones.append(nodo.visitar(self))
+            instrucciones.append((yield nodo))
 
         return resultado.format(instrucciones[0],instrucciones[1])
 
@@ -64,19 +110,24 @@ class VisitantePython:
         instrucciones = []
 
         for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+            instrucciones += [(yield nodo)]
 
         return ' '.join(instrucciones) 
 
     def __visitar_expresión(self, nodo_actual):
         """
-        Expresión ::= ExpresiónMatemática Operador ExpresiónMatemática
+        Expresión ::= Operando (Operador Operando)+
         """
 
         instrucciones = []
 
+        # Las subexpresiones van entre paréntesis para no depender de la
+        # precedencia de python
         for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+            if nodo.tipo is TipoNodo.EXPRESIÓN:
+                instrucciones += ['(' + (yield nodo) + ')']
+            else:
+                instrucciones += [(yield nodo)]
 
         return ' '.join(instrucciones) 
     
@@ -86,7 +137,7 @@ class VisitantePython:
         Traduce a if/elif/else encadenados en un solo método.
         """
         lines = []
-        expr = nodo_actual.nodos[0].visitar(self)
+        expr = (yield nodo_actual.nodos[0])
         primero = True
         
         for nodo in nodo_actual.nodos[1:]:
@@ -94,16 +145,15 @@ class VisitantePython:
                 # Prepara atributos para movida
                 nodo.atributos['primero'] = primero
                 nodo.atributos['expr'] = expr
-                lines.append(nodo.visitar(self))
+                lines.append((yield nodo))
                 primero = False
             elif nodo.tipo == TipoNodo.SINO:
                 # Directamente el else completo
-                lines.append(nodo.visitar(self))
+                lines.append((yield nodo))
         
         # Une todos los bloques con la indentación correcta
         resultado_lines = []
-        for i, line in enumerate(lines):
-            line_parts = line.split('\n')
+        for i, line_parts in enumerate(lines):
             for j, part in enumerate(line_parts):
                 if j == 0:
                     # La primera línea (if/elif/else)
@@ -117,17 +167,17 @@ class VisitantePython:
                     # Las demás líneas ya vienen indentadas correctamente
                     resultado_lines.append(part)
         
-        return '\n'.join(resultado_lines)
+        return resultado_lines
 
     def __visitar_movida(self, nodo_actual):
         """
         MOVIDA ::= 'movida' Valor BloqueInstrucciones
-        Genera 'if expr == valor:' o 'elif expr == valor:' y su bloque en un solo string.
+        Genera 'if expr == valor:' o 'elif expr == valor:' y su bloque en una lista de líneas.
         """
         primero = nodo_actual.atributos.pop('primero')
         expr = nodo_actual.atributos.pop('expr')
-        valor = nodo_actual.nodos[0].visitar(self)
-        cuerpo = nodo_actual.nodos[1].visitar(self)  # Esto ya retorna lista con indentación correcta
+        valor = (yield nodo_actual.nodos[0])
+        cuerpo = (yield nodo_actual.nodos[1])  # Esto ya retorna lista con indentación correcta
         
         tipo = 'if' if primero else 'elif'
         
@@ -135,26 +185,22 @@ class VisitantePython:
         resultado = f"{tipo} {expr} == {valor}:"
         
         # El cuerpo ya viene como lista de líneas correctamente indentadas
-        bloque_lines = [resultado] + cuerpo
-        
-        return '\n'.join(bloque_lines)
+        return [resultado] + cuerpo
 
     def __visitar_try_catch(self, nodo_actual):
         """
         TryCatch ::= juéguesela { BloqueInstrucciones } tortón { BloqueInstrucciones }
         """
         
-        resultado = """try:\n{}\n{}except:\n{}"""
-        
         instrucciones = []
         
         # Visita los dos bloques de instrucciones
         for nodo in nodo_actual.nodos:
-            instrucciones.append(nodo.visitar(self))
+            instrucciones.append((yield nodo))
         
         # instrucciones[0] es el bloque try, instrucciones[1] es el bloque except
         # Se agrega la indentación base para el except
-        return resultado.format('\n'.join(instrucciones[0]), self.__retornar_tabuladores(), '\n'.join(instrucciones[1]))
+        return ['try:'] + instrucciones[0] + [self.__retornar_tabuladores() + 'except:'] + instrucciones[1]
 
     def __visitar_dele_vuelta(self, nodo_actual):
         """
@@ -165,7 +211,7 @@ class VisitantePython:
         
         # Visita la inicialización, condición, incremento y bloque
         for nodo in nodo_actual.nodos:
-            instrucciones.append(nodo.visitar(self))
+            instrucciones.append((yield nodo))
         
         # instrucciones[0] = inicialización (ej: "i = 0")
         # instrucciones[1] = condición (ej: "i < largo_texto" o "i > 0") 
@@ -236,12 +282,12 @@ class VisitantePython:
         # Construir el range con los 3 parámetros
         if step == "1":
             # Caso más común, omitir step por claridad
-            resultado = f"for {variable} in range({start}, {stop}):\n{{}}"
+            resultado = f"for {variable} in range({start}, {stop}):"
         else:
             # Usar los 3 parámetros completos
-            resultado = f"for {variable} in range({start}, {stop}, {step}):\n{{}}"
+            resultado = f"for {variable} in range({start}, {stop}, {step}):"
         
-        return resultado.format('\n'.join(instrucciones[3]))
+        return [resultado] + instrucciones[3]
     
     def __visitar_función(self, nodo_actual):
         """
@@ -253,7 +299,7 @@ class VisitantePython:
         instrucciones = []
 
         for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+            instrucciones += [(yield nodo)]
 
         return resultado.format(instrucciones[0],instrucciones[1], '\n'.join(instrucciones[2]))
 
@@ -267,7 +313,7 @@ class VisitantePython:
         instrucciones = []
 
         for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+            instrucciones += [(yield nodo)]
 
         return resultado.format(instrucciones[0], instrucciones[1])
 
@@ -278,7 +324,7 @@ class VisitantePython:
         parámetros = []
 
         for nodo in nodo_actual.nodos:
-            parámetros.append(nodo.visitar(self))
+            parámetros.append((yield nodo))
 
         if len(parámetros) > 0:
             return ','.join(parámetros)
@@ -295,7 +341,7 @@ class VisitantePython:
         parámetros = []
 
         for nodo in nodo_actual.nodos:
-            parámetros.append(nodo.visitar(self))
+            parámetros.append((yield nodo))
 
         if len(parámetros) > 0:
             return ','.join(parámetros)
@@ -313,7 +359,7 @@ class VisitantePython:
         valor = ""
 
         for nodo in nodo_actual.nodos:
-            valor = nodo.visitar(self)
+            valor = (yield nodo)
 
         return valor
 
@@ -323,63 +369,60 @@ class VisitantePython:
         Repetición ::= upee ( Condición ) BloqueInstrucciones
         """
 
-        resultado = """while {}:\n{}"""
+        resultado = """while {}:"""
 
         instrucciones = []
 
         # Visita la condición
         for nodo in nodo_actual.nodos:
-            instrucciones.append(nodo.visitar(self))
+            instrucciones.append((yield nodo))
 
-        return resultado.format(instrucciones[0],'\n'.join(instrucciones[1]))
+        return [resultado.format(instrucciones[0])] + instrucciones[1]
 
     def __visitar_bifurcación(self, nodo_actual):
         """
         Bifurcación ::= DiaySi (Sino)?
         """
 
-        resultado = """{}{}"""
-
         instrucciones = []
 
         # Visita los dos nodos en el siguiente nivel si los hay
         for nodo in nodo_actual.nodos:
-            instrucciones.append(nodo.visitar(self))
+            instrucciones.append((yield nodo))
 
-        return resultado.format(instrucciones[0], '')
+        return instrucciones[0]
 
     def __visitar_diaysi(self, nodo_actual):
         """
         DiaySi ::= diay siii ( Condición ) BloqueInstrucciones
         """
 
-        resultado = """if {}:\n{}"""
+        resultado = """if {}:"""
 
         instrucciones = []
 
         for nodo in nodo_actual.nodos:
-            instrucciones.append(nodo.visitar(self))
+            instrucciones.append((yield nodo))
 
-        return resultado.format(instrucciones[0],'\n'.join(instrucciones[1]))
+        return [resultado.format(instrucciones[0])] + instrucciones[1]
 
     def __visitar_sino(self, nodo_actual):
         """
         Sino ::= sino ni modo BloqueInstrucciones
         """
 
-        resultado = """else:\n  {}"""
-
         instrucciones = []
 
         for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+            instrucciones += [(yield nodo)]
 
-        return resultado.format('\n'.join(instrucciones[0]))
+        bloque = instrucciones[0]
+        return ['else:', '  ' + (bloque[0] if bloque else '')] + bloque[1:]
 
 
     def __visitar_condición(self, nodo_actual):
         """
-        Condición ::= Comparación ((divorcio|casorio) Comparación)?
+        Condición ::= Comparación ((divorcio|casorio) Comparación)*
         """
 
         resultado = """{} {} {}"""
@@ -387,12 +430,15 @@ class VisitantePython:
         instrucciones = []
 
         for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+            if nodo.tipo is TipoNodo.CONDICIÓN:
+                instrucciones += ['(' + (yield nodo) + ')']
+            else:
+                instrucciones += [(yield nodo)]
 
         if len(instrucciones) == 1:
             return resultado.format(instrucciones[0],'', '')
         else:
-            return resultado.format(instrucciones[0],instrucciones[1],instrucciones[2])
+            return ' '.join(instrucciones)
 
 
 
@@ -408,7 +454,7 @@ class VisitantePython:
 
         # Si los 'Valor' son identificadores se asegura que existan (IDENTIFICACIÓN)
         for nodo in nodo_actual.nodos:
-            elementos.append(nodo.visitar(self))
+            elementos.append((yield nodo))
 
         return resultado.format(elementos[0], elementos[1], elementos[2])
 
@@ -429,7 +475,7 @@ class VisitantePython:
         valor = ''
 
         for nodo in nodo_actual.nodos:
-            valor = nodo.visitar(self)
+            valor = (yield nodo)
 
         return resultado.format(valor)
        
@@ -442,7 +488,7 @@ class VisitantePython:
 
         # Verifico si 'Valor' es un identificador que exista (IDENTIFICACIÓN)
         for nodo in nodo_actual.nodos:
-            valor = nodo.visitar(self)
+            valor = (yield nodo)
 
         return resultado.format(valor)
 
@@ -464,7 +510,7 @@ if __name__ == '__main__':
         # Lo pongo así por copy/paste... pero puede ser como el comentario
         # de más abajo.
         for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+            instrucciones += [(yield nodo)]
 
         return resultado.format('\n'.join(instrucciones[0]))
 
@@ -485,6 +531,12 @@ if __name__ == '__main__':
     def __visitar_bloque_instrucciones(self, nodo_actual):
         """
         BloqueInstrucciones ::= { Instrucción+ }
+
+        Retorna una lista de líneas. Las instrucciones que llevan bloque
+        (if, while...) también vienen en líneas, donde solo a la primera
+        le falta la indentación: así el código de adentro no se vuelve a
+        copiar en un string nuevo en cada nivel, que con miles de niveles
+        de anidamiento no termina nunca.
         """
         self.tabuladores += 4
 
@@ -492,12 +544,16 @@ if __name__ == '__main__':
 
         # Visita todas las instrucciones que contiene
         for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+            instrucciones += [(yield nodo)]
 
         instrucciones_tabuladas = []
 
         for instruccion in instrucciones:
-            instrucciones_tabuladas += [self.__retornar_tabuladores() + instruccion]
+            if isinstance(instruccion, list):
+                instrucciones_tabuladas += [self.__retornar_tabuladores() + instruccion[0]]
+                instrucciones_tabuladas += instruccion[1:]
+            else:
+                instrucciones_tabuladas += [self.__retornar_tabuladores() + instruccion]
             
 
         self.tabuladores -= 4
@@ -508,21 +564,15 @@ if __name__ == '__main__':
         """
         Operador ::= (echele | quitele | chuncherequee | desmadeje)
         """
-        if nodo_actual.contenido == 'echele':
-            return '+'
-
-        elif nodo_actual.contenido == 'quitele':
-            return '-'
+        # Nunca debería quedar en 'jijiji'
+        return self.operadores.get(nodo_actual.contenido, 'jijiji')
 
-        elif nodo_actual.contenido == 'chuncherequee':
-            return '*'
 
-        elif nodo_actual.contenido == 'desmadeje':
-            return '/'
-
-        else:
-            # Nunca llega aquí  
-            return 'jijiji'
+    def __visitar_operador_lógico(self, nodo_actual):
+        """
+        OperadorLógico ::= (divorcio | casorio)
+        """
+        return self.operadores_lógicos.get(nodo_actual.contenido, 'jijiji')
 
 
     def __visitar_valor_verdad(self, nodo_actual):
@@ -536,27 +586,8 @@ if __name__ == '__main__':
         """
         Comparador ::= (cañazo | poquitico | misma vara | otra vara | menos o igualitico | más o igualitico)
         """
-        if nodo_actual.contenido == 'cañazo':
-            return '>'
-
-        elif nodo_actual.contenido == 'poquitico':
-            return '<'
-
-        elif nodo_actual.contenido == 'misma vara':
-            return '=='
-
-        elif nodo_actual.contenido == 'otra vara':
-            return '!='
-
-        elif nodo_actual.contenido == 'menos o igualitico':
-            return '<='
-
-        elif nodo_actual.contenido == 'más o igualitico':
-            return '>='
-
-        else:
-            # Nunca llega aquí  
-            return 'jojojo'
+        # Nunca debería quedar en 'jojojo'
+        return self.comparadores.get(nodo_actual.contenido, 'jojojo')
 
 
     def __visitar_texto(self, nodo_actual):
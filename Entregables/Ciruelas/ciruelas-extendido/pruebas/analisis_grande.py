@@ -0,0 +1,101 @@
+# Cuánto dura el analizador con un programa enorme
+#
+# Genera un programa con 100 000 instrucciones (asignaciones, diay siii,
+# upee, llamadas y sarpes repartidos en funciones) y mide
+# Analizador.analizar() sobre los componentes ya explorados. Es lo que
+# hay que correr antes y después de tocar cómo el analizador escoge cada
+# producción (para tener el antes se puede correr el script en una copia
+# del repositorio anterior al cambio; sin --asa-plano solo usa lo que el
+# analizador siempre ha tenido).
+#
+#   python3 -m pruebas.analisis_grande [--instrucciones 100000] [--repeticiones 3]
+
+import argparse
+import time
+
+from explorador.explorador import Explorador
+from analizador.analizador import Analizador
+
+parser = argparse.ArgumentParser(description='Mide el analizador con un programa enorme')
+
+parser.add_argument('--instrucciones', dest='instrucciones', type=int, default=100_000,
+        help='cantidad de instrucciones del programa')
+
+parser.add_argument('--repeticiones', dest='repeticiones', type=int, default=3,
+        help='se reporta la mejor de estas corridas')
+
+parser.add_argument('--asa-plano', dest='plano', action='store_true',
+        help='construir el árbol plano en lugar de NodoÁrbol')
+
+# (cuántas instrucciones son, líneas); las de bloque cuentan la de afuera
+# y la de adentro
+PATRONES = [
+    (1, ['    y metale (y echele x)']),
+    (2, ['    diay siii (y cañazo 100) {', '        y metale (y quitele 100)', '    }']),
+    (2, ['    upee (y poquitico x) {', '        y metale (y chuncherequee 2)', '    }']),
+    (1, ['    llamese sueltele(y)']),
+]
+
+# Instrucciones por función sin contar la primera asignación y el sarpe
+POR_FUNCIÓN = 48
+
+
+def programa_generado(instrucciones):
+    """
+    Las líneas de un programa válido de Ciruelas con más o menos esa
+    cantidad de instrucciones
+    """
+    líneas = []
+    funciones = 0
+    contadas = 0
+
+    while contadas < instrucciones:
+        líneas += [f'mae funcion{funciones}(x){{', '    y metale x']
+        contadas += 1
+
+        en_función = 0
+        número = 0
+        while en_función < POR_FUNCIÓN and contadas < instrucciones:
+            cantidad, patrón = PATRONES[número % len(PATRONES)]
+            líneas += patrón
+            en_función += cantidad
+            contadas += cantidad
+            número += 1
+
+        líneas += ['    sarpe y', '}', '']
+        contadas += 1
+        funciones += 1
+
+    líneas += ['jefe mae {', '    resultado metale llamese funcion0(1)',
+            '    llamese sueltele(resultado)', '    sarpe 0', '}']
+
+    return líneas
+
+
+def principal():
+    args = parser.parse_args()
+
+    exp = Explorador(programa_generado(args.instrucciones))
+    exp.explorar()
+    assert not exp.errores
+
+    mejor = None
+    for _ in range(args.repeticiones):
+        if args.plano:
+            analizador = Analizador(exp.componentes, plano=True)
+        else:
+            analizador = Analizador(exp.componentes)
+
+        inicio = time.perf_counter()
+        analizador.analizar()
+        segundos = time.perf_counter() - inicio
+
+        assert not analizador.errores_sintaxis, analizador.errores_sintaxis[:3]
+        mejor = segundos if mejor is None else min(mejor, segundos)
+
+    print(f'{args.instrucciones} instrucciones, {len(exp.componentes)} componentes:'
+            f' {mejor:.3f} s analizando ({mejor / args.instrucciones * 1e6:.1f} µs por instrucción)')
+
+
+if __name__ == '__main__':
+    principal()
@@ -0,0 +1,162 @@
+# Prueba de programas con miles de niveles de anidamiento
+#
+# 1. Compila de principio a fin (explorador, analizador, verificador,
+#    generador e impresión del árbol) programas con 2 500, 5 000 y 10 000
+#    bloques diay siii / upee anidados, con los dos tipos de árbol. Nada
+#    puede reventar por recursión y el tiempo tiene que crecer
+#    linealmente: el de las primeras fases y la impresión con los niveles
+#    y el del generador con el tamaño del código, que por la indentación
+#    de python crece con el cuadrado de los niveles.
+# 2. Corta el programa de 10 000 niveles en lugares feos (sin los '}', a
+#    media expresión, después de un sarpe) y revisa que --solo-analizar y
+#    --solo-validar terminen y reporten el error al final del archivo.
+#
+#   python3 -m pruebas.anidamiento [--niveles 10000]
+
+import argparse
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from compilador import Compilación
+from generador.generador import Generador
+
+parser = argparse.ArgumentParser(description='Compila programas con muchísimo anidamiento')
+
+parser.add_argument('--niveles', dest='niveles', type=int, default=10000,
+        help='niveles de anidamiento del programa más grande')
+
+parser.add_argument('--tolerancia', dest='tolerancia', type=float, default=2.0,
+        help='''cuántas veces más lento por nivel (o por caracter generado)
+        puede ser el programa más grande que el de la cuarta parte de niveles''')
+
+parser.add_argument('--espera', dest='espera', type=int, default=60,
+        help='segundos que se espera a cada programa cortado antes de darlo por pegado')
+
+
+def abrir(niveles):
+    """
+    Las líneas que abren los niveles del programa, hasta la instrucción
+    más adentro (sin cerrar nada)
+    """
+    líneas = ['jefe mae {', '  x metale 1']
+
+    for nivel in range(niveles):
+        if nivel % 2 == 0:
+            líneas.append('diay siii (x cañazo 0) {')
+        else:
+            líneas.append('upee (x cañazo 0) {')
+
+    return líneas
+
+
+def programa(niveles):
+    return abrir(niveles) + ['x metale (x quitele 1)'] + ['}'] * niveles + ['}']
+
+
+def compilar(niveles, plano):
+    """
+    Compila el programa e imprime el árbol (a ningún lado). Retorna los
+    segundos hasta verificar más los de imprimir, los segundos del
+    generador y el largo del código generado.
+    """
+    inicio = time.perf_counter()
+
+    compilación = Compilación(programa(niveles), plano=plano)
+    if not compilación.compilar(generar=False):
+        raise AssertionError(f'no compiló ({compilación.fase}): {compilación.errores[:3]}')
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        compilación.asa.imprimir_preorden()
+
+    inicio_generador = time.perf_counter()
+    código = Generador(compilación.asa).generar_código()
+    fin = time.perf_counter()
+
+    return inicio_generador - inicio, fin - inicio_generador, len(código)
+
+
+def cortados(niveles):
+    """
+    (nombre, líneas) de los programas cortados
+    """
+    abierto = abrir(niveles)
+
+    return [
+        ('sin cerrar los bloques', abierto + ['x metale 1']),
+        ('a media expresión', abierto + ['x metale (']),
+        ('a media expresión con operador', abierto + ['x metale ((x echele']),
+        ('después de un sarpe', abierto + ['sarpe']),
+        ('sin el último }', programa(niveles)[:-1]),
+    ]
+
+
+def correr_cortado(ruta, opción, espera):
+    """
+    Corre ciruelas.py con el programa cortado y retorna un mensaje si no
+    se portó como se espera (None si todo bien)
+    """
+    try:
+        resultado = subprocess.run([sys.executable, 'ciruelas.py', opción, ruta],
+                capture_output=True, text=True, timeout=espera)
+    except subprocess.TimeoutExpired:
+        return f'no terminó en {espera} s'
+
+    if resultado.returncode != 1:
+        return f'terminó con código {resultado.returncode}: {resultado.stderr[-300:]}'
+
+    if 'se acabó el archivo' not in resultado.stdout:
+        return f'no reportó el fin del archivo: {resultado.stdout[-300:]}'
+
+    return None
+
+
+def principal():
+    args = parser.parse_args()
+    fallas = 0
+
+    # 1. Programas completos
+    for plano in (False, True):
+        por_nivel = []
+        por_caracter = []
+
+        for niveles in (args.niveles // 4, args.niveles // 2, args.niveles):
+            segundos, segundos_generador, largo = compilar(niveles, plano)
+            por_nivel.append(segundos / niveles)
+            por_caracter.append(segundos_generador / largo)
+            print(f'{"plano" if plano else "nodos"} {niveles:>6} niveles {segundos:7.3f} s,'
+                    f' generador {segundos_generador:7.3f} s para {largo} caracteres')
+
+        for nombre, tiempos, unidad in (('fases', por_nivel, 'nivel'),
+                ('generador', por_caracter, 'caracter')):
+            razón = tiempos[-1] / tiempos[0]
+            print(f'    {nombre}: {razón:.2f} veces más por {unidad} con {args.niveles} niveles que con {args.niveles // 4}')
+
+            if razón > args.tolerancia:
+                print(f'ERROR: el tiempo de {nombre} no está creciendo linealmente')
+                fallas += 1
+
+    # 2. Programas cortados
+    with tempfile.TemporaryDirectory() as carpeta:
+        for número, (nombre, líneas) in enumerate(cortados(args.niveles)):
+            ruta = os.path.join(carpeta, f'cortado{número}.ciru')
+            with open(ruta, 'w', encoding='utf-8') as archivo:
+                archivo.write('\n'.join(líneas))
+
+            for opción in ('--solo-analizar', '--solo-validar'):
+                problema = correr_cortado(ruta, opción, args.espera)
+                print(f'{nombre} ({opción}): {problema or "bien"}')
+                if problema:
+                    fallas += 1
+
+    if fallas:
+        print(f'ERROR: {fallas} fallas')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    principal()
@@ -0,0 +1,124 @@
+# Cargar y explorar un archivo grande línea por línea o con mmap
+#
+# Escribe un archivo de unos 20 MB con las líneas de los ejemplos y lo
+# carga y explora de tres formas, cada una en su propio proceso para que
+# el pico de memoria (RSS) sea solo de esa forma:
+#
+#   - cargar_archivo: línea por línea, como se hace por default
+#   - cargar_texto: mmap y un solo decode, explorado de una sola pasada
+#     (--archivo-completo)
+#   - lineas_texto: el texto de cargar_texto partido en líneas para el
+#     explorador normal
+#
+# También se mide un proceso que no carga nada para saber cuánto es solo
+# de arrancar python e importar el explorador.
+#
+#   python3 -m pruebas.carga_archivos [--megas 20] [--repeticiones 2]
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from utils import archivos
+from explorador.explorador import Explorador
+from pruebas.escalamiento_explorador import líneas_ejemplos
+
+parser = argparse.ArgumentParser(description='Compara las formas de cargar un archivo grande')
+
+parser.add_argument('--megas', dest='megas', type=int, default=20,
+        help='tamaño aproximado del archivo en MB')
+
+parser.add_argument('--repeticiones', dest='repeticiones', type=int, default=2,
+        help='se reporta la más rápida de estas corridas')
+
+# Uso interno: medir una sola forma en este proceso
+parser.add_argument('--medir', dest='medir', nargs=2, metavar=('FORMA', 'RUTA'),
+        help=argparse.SUPPRESS)
+
+FORMAS = ['nada', 'cargar_archivo', 'cargar_texto', 'lineas_texto']
+
+
+def medir(forma, ruta):
+    """
+    Carga y explora el archivo y escribe los componentes, los segundos y
+    el pico de RSS en MB
+    """
+    inicio = time.perf_counter()
+
+    if forma == 'nada':
+        fuente = None
+    elif forma == 'cargar_archivo':
+        fuente = archivos.cargar_archivo(ruta)
+    elif forma == 'cargar_texto':
+        fuente = archivos.cargar_texto(ruta)
+    else:
+        fuente = archivos.lineas_texto(archivos.cargar_texto(ruta))
+
+    componentes = 0
+    if fuente is not None:
+        exp = Explorador(fuente)
+        exp.explorar()
+        assert not exp.errores
+        componentes = len(exp.componentes)
+
+    segundos = time.perf_counter() - inicio
+
+    # En linux ru_maxrss viene en KB
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(componentes, segundos, pico)
+
+
+def correr(forma, ruta):
+    """
+    Mide la forma en otro proceso y retorna (componentes, segundos, MB)
+    """
+    resultado = subprocess.run([sys.executable, '-m', 'pruebas.carga_archivos', '--medir', forma, ruta],
+            capture_output=True, text=True, check=True)
+
+    componentes, segundos, pico = resultado.stdout.split()
+    return int(componentes), float(segundos), float(pico)
+
+
+def principal():
+    args = parser.parse_args()
+
+    if args.medir:
+        medir(*args.medir)
+        return
+
+    base = '\n'.join(líneas_ejemplos()) + '\n'
+    veces = args.megas * 1024 * 1024 // len(base.encode('utf-8')) + 1
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, 'grande.ciru')
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            for _ in range(veces):
+                archivo.write(base)
+
+        print(f'{os.path.getsize(ruta) / 1e6:.1f} MB')
+
+        cantidades = set()
+        for forma in FORMAS:
+            corridas = [correr(forma, ruta) for _ in range(args.repeticiones)]
+            componentes = corridas[0][0]
+            segundos = min(corrida[1] for corrida in corridas)
+            pico = max(corrida[2] for corrida in corridas)
+
+            if forma != 'nada':
+                cantidades.add(componentes)
+
+            print(f'{forma:>15}: {componentes:>9} componentes {segundos:7.2f} s pico {pico:6.0f} MB')
+
+    # Las tres formas tienen que dar los mismos componentes
+    if len(cantidades) != 1:
+        print('ERROR: las formas de cargar no dan la misma cantidad de componentes')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    principal()
@@ -0,0 +1,154 @@
+# Prueba diferencial del autómata (--afd) contra el explorador con regex
+#
+# 1. En los ejemplos los dos exploradores tienen que dar exactamente los
+#    mismos componentes léxicos y errores.
+# 2. En líneas armadas al azar con pedazos complicados (prefijos de
+#    palabras clave, tildes, tabuladores, comentarios, números a medias)
+#    el autómata tiene que dar siempre el componente más largo posible.
+#    Eso se compara con un oráculo que prueba cada descriptor por aparte.
+#    Ahí el regex puede diferir (mae en maestro); se cuenta pero no falla.
+# 3. Mide cuánto dura cada uno explorando los ejemplos varias veces.
+#
+#   python3 -m pruebas.diferencial_afd [--casos 20000] [--repeticiones 50]
+
+import argparse
+import glob
+import random
+import re
+import sys
+import time
+
+from utils import archivos
+from explorador.explorador import Explorador, TipoComponente
+
+parser = argparse.ArgumentParser(description='Compara el autómata con el explorador con regex')
+
+parser.add_argument('--casos', dest='casos', type=int, default=20000,
+        help='cantidad de líneas al azar')
+
+parser.add_argument('--repeticiones', dest='repeticiones', type=int, default=50,
+        help='cuántas veces se exploran los ejemplos para medir')
+
+parser.add_argument('--semilla', dest='semilla', type=int, default=5)
+
+# Pedazos con que se arman las líneas al azar
+pedazos = ['mae', 'maestro', 'x', '\t', ' ', '~a\tb~', '~', '~~', 'Bomba: c',
+        '*', '12', '-3.5', '3.', '(', ')', 'metale', 'como está la vara', 'é',
+        'sarpero', 'True', 'Falsey', 'diay siii', 'upeee', 'movidas', '1.2.3']
+
+descriptores = [(tipo, re.compile(regex)) for tipo, regex in Explorador.descriptores_componentes]
+
+
+def explorar(líneas, afd):
+    """
+    Retorna los componentes y los errores en tuplas para poder compararlos
+    """
+    exp = Explorador(list(líneas), afd)
+    exp.explorar()
+
+    componentes = [(c.tipo, c.texto, c.linea, c.columna) for c in exp.componentes]
+    errores = [(e.mensaje, e.texto, e.linea, e.columna) for e in exp.errores]
+    return componentes, errores
+
+
+def oráculo(línea):
+    """
+    Los componentes de la línea (tipo, texto, columna) tomando en cada
+    posición el descriptor que calce más largo; si empatan gana el
+    primero, igual que en el autómata
+    """
+    resultado = []
+    posición = 0
+    columna = 1
+
+    while posición < len(línea):
+        mejor = None
+
+        for tipo, regex in descriptores:
+            calce = regex.match(línea[posición:])
+            if calce and (mejor is None or calce.end() > mejor[1]):
+                mejor = (tipo, calce.end())
+
+        # Caracter desconocido
+        if mejor is None:
+            posición += 1
+            columna += 1
+            continue
+
+        tipo, largo = mejor
+        texto = línea[posición:posición + largo]
+
+        if tipo is TipoComponente.BLANCOS:
+            columna_siguiente = columna + largo + 3 * texto.count('\t')
+        else:
+            columna_siguiente = columna + largo
+
+        if tipo is not TipoComponente.BLANCOS and tipo is not TipoComponente.COMENTARIO:
+            resultado.append((tipo, texto, columna))
+
+        columna = columna_siguiente
+        posición += largo
+
+    return resultado
+
+
+def principal():
+    args = parser.parse_args()
+
+    if not Explorador.afd_vigente:
+        print('ERROR: las tablas del autómata no corresponden con los descriptores;'
+                ' hay que correr python3 -m explorador.generar_afd')
+        sys.exit(1)
+
+    fallas = 0
+
+    # 1. Los ejemplos
+    ejemplos = {ruta: list(archivos.cargar_archivo(ruta))
+            for ruta in sorted(glob.glob('docs/ejemplos/*.ciru'))}
+
+    for ruta, líneas in ejemplos.items():
+        if explorar(líneas, False) != explorar(líneas, True):
+            print(f'ERROR: el autómata y el regex no dan lo mismo en {ruta}')
+            fallas += 1
+
+    print(f'{len(ejemplos)} ejemplos comparados')
+
+    # 2. Líneas al azar contra el oráculo
+    azar = random.Random(args.semilla)
+    distintas_regex = 0
+
+    for _ in range(args.casos):
+        línea = ''.join(azar.choice(pedazos) for _ in range(azar.randint(0, 12)))
+
+        esperado = oráculo(línea)
+        afd = [(tipo, texto, columna) for tipo, texto, _, columna in explorar([línea], True)[0]]
+        regex = [(tipo, texto, columna) for tipo, texto, _, columna in explorar([línea], False)[0]]
+
+        if afd != esperado:
+            if fallas < 10:
+                print(f'ERROR: el autómata no da el componente más largo en {línea!r}')
+                print(f'    autómata: {afd}')
+                print(f'    esperado: {esperado}')
+            fallas += 1
+
+        if regex != afd:
+            distintas_regex += 1
+
+    print(f'{args.casos} líneas al azar, {distintas_regex} en que el regex no da el componente más largo')
+
+    # 3. Rendimiento
+    líneas = [línea for texto in ejemplos.values() for línea in texto] * args.repeticiones
+
+    for afd in (False, True):
+        inicio = time.perf_counter()
+        explorar(líneas, afd)
+        segundos = time.perf_counter() - inicio
+        print(f'{"autómata" if afd else "regex":>8}: {len(líneas)} líneas en {segundos:.3f} s')
+
+    if fallas:
+        print(f'ERROR: {fallas} diferencias')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    principal()
@@ -0,0 +1,93 @@
+# Prueba de que Explorador.explorar escala linealmente
+#
+# Arma programas de 1 000 hasta 1 000 000 de líneas repitiendo las líneas
+# de los ejemplos y mide cuánto se dura explorando cada uno. Si el tiempo
+# por componente léxico del más grande se sale mucho del del más pequeño
+# es que algo volvió a ser cuadrático (como cuando se hacía
+# componentes = componentes + resultado por cada línea).
+#
+#   python3 -m pruebas.escalamiento_explorador [--hasta 1000000]
+
+import argparse
+import glob
+import sys
+import time
+
+from utils import archivos
+from explorador.explorador import Explorador
+
+parser = argparse.ArgumentParser(description='Mide si el explorador escala linealmente')
+
+parser.add_argument('--hasta', dest='hasta', type=int, default=1_000_000, metavar='N',
+        help='cantidad de líneas del programa más grande')
+
+parser.add_argument('--tolerancia', dest='tolerancia', type=float, default=3.0,
+        help='''cuántas veces más lento por componente puede ser el programa
+        más grande que el más pequeño''')
+
+
+def líneas_ejemplos():
+    """
+    Las líneas de los ejemplos que el explorador acepta sin errores
+    """
+    líneas = []
+
+    for ruta in sorted(glob.glob('docs/ejemplos/*.ciru')):
+        texto = list(archivos.cargar_archivo(ruta))
+
+        exp = Explorador(texto)
+        exp.explorar()
+        if not exp.errores:
+            líneas += texto
+
+    return líneas
+
+
+def medir(líneas):
+    """
+    Explora las líneas y retorna (componentes, segundos)
+    """
+    exp = Explorador(iter(líneas))
+
+    inicio = time.perf_counter()
+    exp.explorar()
+    segundos = time.perf_counter() - inicio
+
+    assert not exp.errores
+    return len(exp.componentes), segundos
+
+
+def principal():
+    args = parser.parse_args()
+
+    base = líneas_ejemplos()
+
+    tamaños = []
+    tamaño = 1000
+    while tamaño <= args.hasta:
+        tamaños.append(tamaño)
+        tamaño *= 10
+
+    # Una corrida de calentamiento para que el primer tamaño no pague
+    # lo que cuesta arrancar
+    medir(base)
+
+    resultados = []
+    for tamaño in tamaños:
+        líneas = (base * (tamaño // len(base) + 1))[:tamaño]
+        componentes, segundos = medir(líneas)
+        por_componente = segundos / componentes * 1e6
+
+        resultados.append(por_componente)
+        print(f'{tamaño:>9} líneas {componentes:>10} componentes {segundos:8.3f} s {por_componente:6.2f} µs/componente')
+
+    razón = resultados[-1] / resultados[0]
+    print(f'el más grande tarda {razón:.2f} veces más por componente que el más pequeño')
+
+    if razón > args.tolerancia:
+        print('ERROR: la exploración no está escalando linealmente')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    principal()
@@ -0,0 +1,89 @@
+# Prueba de que varias compilaciones pueden correr a la vez
+#
+# Compila los ejemplos uno por uno para tener lo que tiene que salir y
+# después compila todos los ejemplos 1 000 veces repartidos en 16 hilos,
+# mezclando los dos tipos de árbol y los dos exploradores (en cada pasada
+# cada ejemplo usa una variante distinta a la del anterior).
+# Cada compilación tiene que dar exactamente lo mismo que sola (si
+# compiló, la fase, los errores y el código generado); si algo del estado
+# de una compilación quedara compartido entre objetos Compilación se
+# notaría acá.
+#
+#   python3 -m pruebas.hilos [--repeticiones 1000] [--hilos 16]
+
+import argparse
+import glob
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import archivos
+from compilador import Compilación
+
+parser = argparse.ArgumentParser(description='Compila los ejemplos desde muchos hilos a la vez')
+
+parser.add_argument('--repeticiones', dest='repeticiones', type=int, default=1000,
+        help='cuántas veces se compilan todos los ejemplos en los hilos')
+
+parser.add_argument('--hilos', dest='hilos', type=int, default=16,
+        help='cantidad de hilos')
+
+
+def compilar(trabajo):
+    """
+    trabajo es (ruta, líneas, plano, afd). Retorna lo que salió de
+    compilar en una tupla para poder compararla.
+    """
+    ruta, líneas, plano, afd = trabajo
+
+    compilación = Compilación(líneas, afd=afd, plano=plano)
+    bien = compilación.compilar()
+
+    return (bien, compilación.fase, [str(error) for error in compilación.errores],
+            compilación.código)
+
+
+def principal():
+    args = parser.parse_args()
+
+    ejemplos = {ruta: list(archivos.cargar_archivo(ruta))
+            for ruta in sorted(glob.glob('docs/ejemplos/*.ciru'))}
+
+    opciones = [(plano, afd) for plano in (False, True) for afd in (False, True)]
+
+    # Lo que tiene que salir, compilando de uno en uno
+    esperado = {(ruta, plano, afd): compilar((ruta, líneas, plano, afd))
+            for ruta, líneas in ejemplos.items() for plano, afd in opciones}
+
+    trabajos = []
+    for pasada in range(args.repeticiones):
+        for número, (ruta, líneas) in enumerate(ejemplos.items()):
+            plano, afd = opciones[(pasada + número) % len(opciones)]
+            trabajos.append((ruta, líneas, plano, afd))
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.hilos) as grupo:
+        resultados = list(grupo.map(compilar, trabajos))
+    segundos = time.perf_counter() - inicio
+
+    fallas = 0
+    for trabajo, resultado in zip(trabajos, resultados):
+        ruta, _, plano, afd = trabajo
+
+        if resultado != esperado[(ruta, plano, afd)]:
+            if fallas < 10:
+                print(f'ERROR: {ruta} (plano={plano}, afd={afd}) no dio lo mismo que compilado solo')
+            fallas += 1
+
+    bien = sum(resultado[0] for resultado in esperado.values())
+    print(f'{len(trabajos)} compilaciones en {args.hilos} hilos en {segundos:.1f} s'
+            f' ({bien} de {len(esperado)} variantes compilan)')
+
+    if fallas:
+        print(f'ERROR: {fallas} compilaciones distintas')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    principal()
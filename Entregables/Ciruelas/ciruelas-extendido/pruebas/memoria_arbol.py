@@ -0,0 +1,130 @@
+# Memoria y recorrido del árbol con NodoÁrbol y con ÁrbolPlano
+#
+# Analiza un programa generado de alrededor de un millón de nodos con los
+# dos tipos de árbol y mide con tracemalloc el pico de memoria mientras se
+# construye y lo que queda ocupado por el árbol. Después, ya sin
+# tracemalloc, mide el mejor de tres recorridos completos en preorden de
+# cada uno. Falla si el árbol plano no ocupa al menos --objetivo veces
+# menos o si recorrerlo no es más rápido.
+#
+#   python3 -m pruebas.memoria_arbol [--instrucciones 130000]
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from explorador.explorador import Explorador
+from analizador.analizador import Analizador
+from pruebas.analisis_grande import programa_generado
+
+parser = argparse.ArgumentParser(description='Compara NodoÁrbol con ÁrbolPlano')
+
+parser.add_argument('--instrucciones', dest='instrucciones', type=int, default=130_000,
+        help='instrucciones del programa generado (130 000 son como un millón de nodos)')
+
+parser.add_argument('--objetivo', dest='objetivo', type=float, default=5.0,
+        help='cuántas veces menos tiene que ocupar el árbol plano')
+
+
+def recorrer_nodos(asa):
+    """
+    Recorrido en preorden de un ÁrbolSintáxisAbstracta con NodoÁrbol;
+    retorna la cantidad de nodos
+    """
+    cantidad = 0
+    pendientes = [asa.raiz]
+
+    while pendientes:
+        nodo = pendientes.pop()
+        cantidad += 1
+        pendientes.extend(reversed(nodo.nodos))
+
+    return cantidad
+
+
+def recorrer_plano(asa):
+    """
+    Recorrido en preorden de un ÁrbolPlano; retorna la cantidad de nodos
+    """
+    cantidad = 0
+
+    for _ in asa.preorden():
+        cantidad += 1
+
+    return cantidad
+
+
+def medir(componentes, plano):
+    """
+    Retorna (nodos, pico, ocupados, segundos recorriendo)
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    analizador = Analizador(componentes, plano)
+    analizador.analizar()
+    assert not analizador.errores_sintaxis, analizador.errores_sintaxis[:3]
+
+    # Lo que queda es el árbol (el analizador ya no guarda nada más)
+    asa = analizador.asa
+    del analizador
+    gc.collect()
+
+    ocupados, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    recorrer = recorrer_plano if plano else recorrer_nodos
+
+    segundos = None
+    for _ in range(3):
+        inicio = time.perf_counter()
+        nodos = recorrer(asa)
+        duración = time.perf_counter() - inicio
+        segundos = duración if segundos is None else min(segundos, duración)
+
+    return nodos, pico, ocupados, segundos
+
+
+def principal():
+    args = parser.parse_args()
+
+    exp = Explorador(programa_generado(args.instrucciones))
+    exp.explorar()
+    assert not exp.errores
+
+    resultados = {}
+    for nombre, plano in (('NodoÁrbol', False), ('ÁrbolPlano', True)):
+        nodos, pico, ocupados, segundos = medir(exp.componentes, plano)
+        resultados[nombre] = (pico, ocupados, segundos)
+
+        print(f'{nombre:>10}: {nodos} nodos, pico {pico / 1e6:7.1f} MB, árbol {ocupados / 1e6:7.1f} MB,'
+                f' recorrido {segundos:.3f} s')
+
+    nodos_árbol = resultados['NodoÁrbol']
+    plano_árbol = resultados['ÁrbolPlano']
+
+    razón_pico = nodos_árbol[0] / plano_árbol[0]
+    razón_memoria = nodos_árbol[1] / plano_árbol[1]
+    razón_recorrido = nodos_árbol[2] / plano_árbol[2]
+
+    print(f'el árbol plano ocupa {razón_memoria:.1f} veces menos (pico {razón_pico:.1f} veces menos)'
+            f' y se recorre {razón_recorrido:.2f} veces más rápido')
+
+    fallas = 0
+
+    if razón_memoria < args.objetivo:
+        print(f'ERROR: el árbol plano no ocupa {args.objetivo} veces menos')
+        fallas += 1
+
+    if razón_recorrido <= 1:
+        print('ERROR: el árbol plano no se recorre más rápido')
+        fallas += 1
+
+    if fallas:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    principal()
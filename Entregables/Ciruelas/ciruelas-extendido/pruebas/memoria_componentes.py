@@ -0,0 +1,88 @@
+# Cuánta memoria ocupa cada componente léxico
+#
+# Explora las líneas de los ejemplos repetidas hasta tener un programa
+# grande y mide con tracemalloc los bytes por componente de dos formas:
+# ComponenteLéxico con __slots__ (como está ahora) y la misma clase con un
+# __dict__ por instancia (como estaba antes). Las dos listas se arman con
+# los mismos textos y números, así que solo cuenta lo que cuesta cada
+# objeto. También dice cuánto ocupa en total lo que deja la exploración.
+# Falla si ComponenteLéxico no ocupa menos que con __dict__.
+#
+#   python3 -m pruebas.memoria_componentes [--lineas 100000]
+
+import argparse
+import sys
+import tracemalloc
+
+from explorador.explorador import Explorador, ComponenteLéxico, TipoComponente
+from pruebas.escalamiento_explorador import líneas_ejemplos
+
+parser = argparse.ArgumentParser(description='Mide los bytes por componente léxico')
+
+parser.add_argument('--lineas', dest='lineas', type=int, default=100_000,
+        help='cantidad de líneas del programa')
+
+
+class ComponenteConDict:
+    """
+    ComponenteLéxico como era antes de __slots__
+    """
+
+    tipo    : TipoComponente
+    texto   : str
+    linea   : int
+    columna : int
+
+    def __init__(self, tipo_nuevo: TipoComponente, texto_nuevo: str, linea: int, columna):
+        self.tipo = tipo_nuevo
+        self.texto = texto_nuevo
+        self.linea = linea
+        self.columna = columna
+
+
+def medir(armar):
+    """
+    Corre armar() y retorna lo que retornó y los bytes que quedaron
+    ocupados
+    """
+    tracemalloc.start()
+    resultado = armar()
+    ocupados, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return resultado, ocupados
+
+
+def principal():
+    args = parser.parse_args()
+
+    base = líneas_ejemplos()
+    líneas = (base * (args.lineas // len(base) + 1))[:args.lineas]
+
+    def explorar():
+        exp = Explorador(iter(líneas))
+        exp.explorar()
+        return exp.componentes
+
+    componentes, total = medir(explorar)
+    cantidad = len(componentes)
+
+    print(f'{args.lineas} líneas, {cantidad} componentes')
+    print(f'la exploración deja {total / cantidad:.1f} bytes por componente (con los textos y la lista)')
+
+    resultados = []
+    for nombre, clase in (('con __dict__', ComponenteConDict), ('con __slots__', ComponenteLéxico)):
+        _, ocupados = medir(lambda: [clase(c.tipo, c.texto, c.linea, c.columna) for c in componentes])
+        resultados.append(ocupados / cantidad)
+        print(f'{nombre:>14}: {ocupados / cantidad:6.1f} bytes por componente')
+
+    print(f'con __slots__ cada componente ocupa {resultados[0] / resultados[1]:.2f} veces menos')
+
+    # Si a alguien se le ocurre quitarle __slots__ a ComponenteLéxico
+    if resultados[1] >= resultados[0]:
+        print('ERROR: ComponenteLéxico ocupa lo mismo que con __dict__')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    principal()
@@ -1,5 +1,7 @@
 # Utilitarios para manejar archivos
 
+import mmap
+
 def cargar_archivo(ruta_archivo):
     """
     Carga un archivo y lo retorna cómo un solo string pero línea por línea
@@ -10,4 +12,50 @@ def cargar_archivo(ruta_archivo):
         for linea in archivo:
             yield linea.strip("\n")
 
-   
+def cargar_texto(ruta_archivo):
+    """
+    Carga un archivo y lo retorna completo en un solo string (para el modo
+    de exploración de archivo completo)
+
+    El archivo se mapea en memoria y se decodifica de un solo golpe, sin
+    pasar por el búfer de lectura de python ni crear un string por línea.
+    Los saltos de línea quedan igual que al abrirlo en modo texto.
+    """
+
+    with open(ruta_archivo, 'rb') as archivo:
+
+        # mmap no puede mapear un archivo vacío
+        try:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return ''
+
+        with mapa:
+            texto = str(mapa, 'utf-8')
+
+    if '\r' in texto:
+        texto = texto.replace('\r\n', '\n').replace('\r', '\n')
+
+    return texto
+
+def lineas_texto(texto):
+    """
+    Recorre un texto cargado con cargar_texto línea por línea, igual que
+    cargar_archivo, para usarlo con el explorador normal
+
+    Cada línea se corta hasta que se ocupa, así que nunca están todas en
+    memoria a la vez además del texto
+    """
+
+    inicio = 0
+
+    # Un salto al final del archivo no es una línea más
+    while inicio < len(texto):
+        fin = texto.find('\n', inicio)
+
+        if fin == -1:
+            yield texto[inicio:]
+            return
+
+        yield texto[inicio:fin]
+        inicio = fin + 1
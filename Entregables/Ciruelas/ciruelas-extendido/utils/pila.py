@@ -0,0 +1,73 @@
+# Utilitario para recorrer estructuras anidadas sin recursión de python
+#
+# El analizador y los visitadores se escriben cómo si fueran recursivos,
+# pero en lugar de llamarse a sí mismos hacen
+#
+#     resultado = yield lo_que_hay_que_procesar
+#
+# y ejecutar() se encarga de procesarlo con una pila explícita. Así la
+# profundidad de anidamiento no depende del límite de recursión de python
+# sino de la memoria.
+
+from types import GeneratorType
+
+
+def ejecutar(rutina, despachar=None):
+    """
+    Corre rutina (un generador) hasta el final y retorna lo que ella
+    retorne.
+
+    Cada vez que una rutina hace yield de algo se pasa por despachar (si
+    hay) y:
+        - si da otro generador se apila y se corre primero; lo que
+          retorne se le manda de vuelta a la rutina que lo pidió
+        - si da cualquier otra cosa se le manda de vuelta de una vez
+
+    Si una rutina levanta una excepción se le levanta a la que la pidió
+    en el yield, igual que si fuera una llamada normal. Así una
+    producción puede atrapar los errores de sus hijas. Lo mismo si la
+    excepción sale de despachar (o de un visitador que no es generador y
+    corre adentro): se le levanta a la rutina que hizo el yield.
+
+    Si rutina no es un generador se retorna tal cual.
+    """
+    pila = []
+    resultado = rutina
+    error = None
+
+    while True:
+
+        if error is None:
+            if type(resultado) is GeneratorType:
+                pila.append(resultado)
+                resultado = None
+
+            elif not pila:
+                return resultado
+
+        try:
+            if error is None:
+                resultado = pila[-1].send(resultado)
+            else:
+                excepción, error = error, None
+                resultado = pila[-1].throw(excepción)
+
+        except StopIteration as fin:
+            pila.pop()
+            resultado = fin.value
+            continue
+
+        except Exception as excepción:
+            pila.pop()
+            if not pila:
+                raise
+            error = excepción
+            continue
+
+        if despachar is not None:
+            # La rutina que hizo el yield sigue en la pila, así que es a
+            # ella a la que le toca el error (no se saca de la pila)
+            try:
+                resultado = despachar(resultado)
+            except Exception as excepción:
+                error = excepción
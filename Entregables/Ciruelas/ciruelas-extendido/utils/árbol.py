@@ -38,55 +38,84 @@ class TipoNodo(Enum):
     DELE_VUELTA = auto()
     TRY_CATCH = auto()
 
-import copy
-
 class NodoÁrbol:
 
     tipo      : TipoNodo
     contenido : str
     atributos : dict
 
-    def __init__(self, tipo, linea = None, columna = None, contenido = None, nodos = [], atributos = {}):
+    # Se crean montones de nodos así que no llevan __dict__ y los
+    # atributos se crean hasta que alguien los ocupe (normalmente el
+    # verificador cuando anota el tipo)
+    __slots__ = ('tipo', 'contenido', 'nodos', '__atributos', 'linea', 'columna')
+
+    def __init__(self, tipo, linea = None, columna = None, contenido = None, nodos = None, atributos = None):
 
         self.tipo      = tipo
         self.contenido = contenido
-        self.nodos     = nodos
-        self.atributos = copy.deepcopy(atributos)
+
+        # Ojo: nada de listas o diccionarios por default en los parámetros
+        # por que python los comparte entre todos los nodos
+        self.nodos     = [] if nodos is None else nodos
+
+        # Los valores de los atributos son tipos (enums) así que basta
+        # con una copia simple para no compartir el diccionario con quien
+        # lo pasó
+        self.__atributos = dict(atributos) if atributos else None
+
         self.linea = linea
         self.columna = columna
 
+    @property
+    def atributos(self):
+        if self.__atributos is None:
+            self.__atributos = {}
+        return self.__atributos
+
+    @atributos.setter
+    def atributos(self, atributos):
+        self.__atributos = atributos
+
     def visitar(self, visitador):
         return visitador.visitar(self)
 
 
     def __str__(self):
+        return formatear_nodo(self.tipo, self.contenido, self.__atributos, self.nodos)
 
-        # Coloca la información del nodo
-        resultado = '{:30}\t'.format(self.tipo)
-        
-        if self.contenido is not None:
-            resultado += '{:10}\t'.format(self.contenido)
-        else:
-            resultado += '{:10}\t'.format('')
 
+def formatear_nodo(tipo, contenido, atributos, nodos):
+    """
+    Texto con que se imprime un nodo en el preorden (también lo usa el
+    árbol plano)
+    """
+
+    # Coloca la información del nodo
+    resultado = '{:30}\t'.format(tipo)
+    
+    if contenido is not None:
+        resultado += '{:10}\t'.format(contenido)
+    else:
+        resultado += '{:10}\t'.format('')
 
-        if self.atributos != {}:
-            resultado += '{:38}'.format(str(self.atributos))
-        else:
-            resultado += '{:38}\t'.format('')
 
-        if self.nodos != []:
-            resultado += '<'
+    if atributos:
+        resultado += '{:38}'.format(str(atributos))
+    else:
+        resultado += '{:38}\t'.format('')
 
-            # Imprime los tipos de los nodos del nivel siguiente
-            for nodo in self.nodos[:-1]:
-                if nodo is not None:
-                    resultado += '{},'.format(nodo.tipo)
+    if nodos != []:
+        resultado += '<'
 
-            resultado += '{}'.format(self.nodos[-1].tipo)
-            resultado += '>'
+        # Imprime los tipos de los nodos del nivel siguiente
+        for nodo in nodos[:-1]:
+            if nodo is not None:
+                resultado += '{},'.format(nodo.tipo)
 
-        return resultado
+        resultado += '{}'.format(nodos[-1].tipo)
+        resultado += '>'
+
+    return resultado
 
 
 class ÁrbolSintáxisAbstracta:
@@ -98,8 +127,14 @@ class ÁrbolSintáxisAbstracta:
 
     def __preorden(self, nodo):
 
-        print(nodo)
+        # Con una pila en lugar de recursión para que aguante árboles muy
+        # profundos. Los hijos se apilan al revés para que salgan en orden.
+        pendientes = [nodo]
+
+        while pendientes:
+            nodo = pendientes.pop()
+
+            print(nodo)
 
-        if nodo is not None:
-            for nodo in nodo.nodos:
-                self.__preorden(nodo)
+            if nodo is not None:
+                pendientes.extend(reversed(nodo.nodos))
@@ -0,0 +1,283 @@
+# Árbol de sintáxis abstracta guardado en arreglos paralelos
+#
+# En lugar de un objeto NodoÁrbol (con su lista de nodos y su diccionario
+# de atributos) por cada nodo, cada nodo es una posición en varios
+# arreglos: tipo, padre, primer hijo, siguiente hermano, línea, columna,
+# contenido y tipo de datos. Para programas enormes esto gasta una
+# fracción de la memoria.
+#
+# Los visitadores no tienen que saber nada de esto: VistaNodo tiene los
+# mismos campos que NodoÁrbol (tipo, contenido, nodos, atributos, linea,
+# columna) pero los lee y escribe directamente en los arreglos.
+
+from array import array
+from collections.abc import MutableMapping
+
+from utils.árbol import TipoNodo, formatear_nodo
+from utils.tipo_datos import TipoDatos
+
+# -1 es 'no hay' en todos los arreglos de números
+NINGUNO = -1
+
+# Para pasar del número guardado en los arreglos al enum y viceversa
+TIPOS_NODO = {tipo.value: tipo for tipo in TipoNodo}
+TIPOS_DATOS = {tipo.value: tipo for tipo in TipoDatos}
+
+
+class ÁrbolPlano:
+    """
+    Árbol de sintáxis abstracta con los nodos en arreglos paralelos.
+
+    Se construye con nuevo_nodo (mismos parámetros que NodoÁrbol) y se
+    recorre con las vistas que retorna o, más rápido, con preorden() que
+    da solo los números de los nodos.
+    """
+
+    raiz : 'VistaNodo'
+
+    def __init__(self):
+
+        self.raiz = None
+
+        self.tipos               = array('b')
+        self.padres              = array('i')
+        self.primeros_hijos      = array('i')
+        self.siguientes_hermanos = array('i')
+        self.lineas              = array('i')
+        self.columnas            = array('i')
+        self.contenidos          = array('i')
+        self.tipos_datos         = array('b')
+
+        # Cada texto distinto se guarda una sola vez; el arreglo de
+        # contenidos tiene la posición en esta lista
+        self.textos = []
+        self.__números_texto = {}
+
+        # Los atributos que no son 'tipo' (casi nunca hay) por nodo
+        self.otros_atributos = {}
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def nuevo_nodo(self, tipo, linea = None, columna = None, contenido = None, nodos = None, atributos = None):
+        """
+        Agrega un nodo y retorna su vista. Recibe lo mismo que
+        NodoÁrbol.
+        """
+        número = len(self.tipos)
+
+        self.tipos.append(tipo.value)
+        self.padres.append(NINGUNO)
+        self.primeros_hijos.append(NINGUNO)
+        self.siguientes_hermanos.append(NINGUNO)
+        self.lineas.append(NINGUNO if linea is None else linea)
+        self.columnas.append(NINGUNO if columna is None else columna)
+        self.contenidos.append(NINGUNO if contenido is None else self.número_texto(contenido))
+        self.tipos_datos.append(0)
+
+        if nodos:
+            self.enlazar_hijos(número, nodos)
+
+        if atributos:
+            vista_atributos = AtributosNodo(self, número)
+            for llave, valor in atributos.items():
+                vista_atributos[llave] = valor
+
+        return VistaNodo(self, número)
+
+    def número_texto(self, texto):
+        """
+        Retorna la posición del texto en la tabla de textos del árbol,
+        agregándolo si es la primera vez que aparece
+        """
+        número = self.__números_texto.get(texto)
+
+        if número is None:
+            número = len(self.textos)
+            self.textos.append(texto)
+            self.__números_texto[texto] = número
+
+        return número
+
+    def hijos(self, número):
+        """
+        Números de los hijos del nodo en orden
+        """
+        resultado = []
+        hijo = self.primeros_hijos[número]
+
+        while hijo != NINGUNO:
+            resultado.append(hijo)
+            hijo = self.siguientes_hermanos[hijo]
+
+        return resultado
+
+    def enlazar_hijos(self, número, nodos):
+        """
+        Reemplaza los hijos del nodo por nodos (vistas de este mismo
+        árbol)
+        """
+        anterior = NINGUNO
+
+        for nodo in nodos:
+            hijo = nodo.número
+
+            self.padres[hijo] = número
+            self.siguientes_hermanos[hijo] = NINGUNO
+
+            if anterior == NINGUNO:
+                self.primeros_hijos[número] = hijo
+            else:
+                self.siguientes_hermanos[anterior] = hijo
+
+            anterior = hijo
+
+        if anterior == NINGUNO:
+            self.primeros_hijos[número] = NINGUNO
+
+    def preorden(self, número=None):
+        """
+        Recorre los números de los nodos en preorden a partir del nodo (por
+        default la raíz) sin crear ninguna vista
+
+        No ocupa pila: baja por el primer hijo y cuando no hay se devuelve
+        por los padres hasta encontrar un hermano siguiente
+        """
+        if número is None:
+            número = self.raiz.número
+
+        primeros_hijos = self.primeros_hijos
+        siguientes_hermanos = self.siguientes_hermanos
+        padres = self.padres
+
+        inicio = número
+
+        while True:
+            yield número
+
+            hijo = primeros_hijos[número]
+            if hijo != NINGUNO:
+                número = hijo
+                continue
+
+            # Los hermanos del nodo de inicio no son parte del recorrido
+            while número != inicio and siguientes_hermanos[número] == NINGUNO:
+                número = padres[número]
+
+            if número == inicio:
+                return
+
+            número = siguientes_hermanos[número]
+
+    def imprimir_preorden(self):
+        for número in self.preorden():
+            print(VistaNodo(self, número))
+
+
+class VistaNodo:
+    """
+    Un nodo del ÁrbolPlano visto cómo si fuera un NodoÁrbol
+    """
+
+    __slots__ = ('árbol', 'número')
+
+    def __init__(self, árbol, número):
+        self.árbol = árbol
+        self.número = número
+
+    @property
+    def tipo(self):
+        return TIPOS_NODO[self.árbol.tipos[self.número]]
+
+    @property
+    def contenido(self):
+        número_texto = self.árbol.contenidos[self.número]
+        return None if número_texto == NINGUNO else self.árbol.textos[número_texto]
+
+    @property
+    def linea(self):
+        linea = self.árbol.lineas[self.número]
+        return None if linea == NINGUNO else linea
+
+    @property
+    def columna(self):
+        columna = self.árbol.columnas[self.número]
+        return None if columna == NINGUNO else columna
+
+    @property
+    def padre(self):
+        padre = self.árbol.padres[self.número]
+        return None if padre == NINGUNO else VistaNodo(self.árbol, padre)
+
+    @property
+    def nodos(self):
+        # Es una lista nueva cada vez: para cambiar los hijos hay que
+        # asignarla completa (nodo.nodos = ... o nodo.nodos += ...)
+        return [VistaNodo(self.árbol, hijo) for hijo in self.árbol.hijos(self.número)]
+
+    @nodos.setter
+    def nodos(self, nodos):
+        self.árbol.enlazar_hijos(self.número, nodos)
+
+    @property
+    def atributos(self):
+        return AtributosNodo(self.árbol, self.número)
+
+    def visitar(self, visitador):
+        return visitador.visitar(self)
+
+    def __str__(self):
+        return formatear_nodo(self.tipo, self.contenido, self.atributos, self.nodos)
+
+
+class AtributosNodo(MutableMapping):
+    """
+    Los atributos de un nodo del ÁrbolPlano con la misma cara que un
+    diccionario. El 'tipo' (que es el que se usa siempre) vive en el
+    arreglo tipos_datos y lo demás en otros_atributos.
+    """
+
+    __slots__ = ('árbol', 'número')
+
+    def __init__(self, árbol, número):
+        self.árbol = árbol
+        self.número = número
+
+    def __getitem__(self, llave):
+        if llave == 'tipo':
+            tipo = self.árbol.tipos_datos[self.número]
+            if tipo == 0:
+                raise KeyError(llave)
+            return TIPOS_DATOS[tipo]
+
+        return self.árbol.otros_atributos.get(self.número, {})[llave]
+
+    def __setitem__(self, llave, valor):
+        if llave == 'tipo':
+            self.árbol.tipos_datos[self.número] = valor.value
+        else:
+            self.árbol.otros_atributos.setdefault(self.número, {})[llave] = valor
+
+    def __delitem__(self, llave):
+        if llave == 'tipo':
+            if self.árbol.tipos_datos[self.número] == 0:
+                raise KeyError(llave)
+            self.árbol.tipos_datos[self.número] = 0
+            return
+
+        otros = self.árbol.otros_atributos.get(self.número, {})
+        del otros[llave]
+        if not otros:
+            del self.árbol.otros_atributos[self.número]
+
+    def __iter__(self):
+        if self.árbol.tipos_datos[self.número] != 0:
+            yield 'tipo'
+        yield from self.árbol.otros_atributos.get(self.número, {})
+
+    def __len__(self):
+        return (self.árbol.tipos_datos[self.número] != 0) + \
+                len(self.árbol.otros_atributos.get(self.número, {}))
+
+    def __repr__(self):
+        return repr(dict(self))
@@ -1,38 +1,110 @@
 # Implementa el veficador de ciruelas
 
-import sys
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
 from typing import List, Dict
 
 from utils.árbol import ÁrbolSintáxisAbstracta, NodoÁrbol, TipoNodo
+from utils.árbol_plano import TIPOS_NODO
+from utils import pila
 from utils.tipo_datos import TipoDatos
-from explorador.explorador import ErrorCompilacion
+from explorador.explorador import ErrorCompilacion, ErrorFatal
+
+class AmbienteBase:
+    """
+    Las funciones nativas (el ambiente estándar) que ven todos los
+    programas. Se arma una sola vez y no se puede cambiar, así que todas
+    las tablas de símbolos (de cualquier hilo) lo comparten sin copiarlo.
+
+    Para agregar funciones nativas se hace otro ambiente con
+    con_funciones y se le pasa al Verificador.
+    """
+
+    def __init__(self, funciones=()):
+        """
+        funciones son tuplas (nombre, tipo de retorno)
+        """
+        self.funciones = tuple(funciones)
+
+        registros = {}
+        for nombre, tipo in self.funciones:
+            nodo = NodoÁrbol(TipoNodo.FUNCIÓN, contenido=nombre, atributos= {'tipo': tipo})
+            registros.setdefault(nombre, MappingProxyType({
+                'nombre': nombre, 'profundidad': 0, 'referencia': nodo}))
+
+        self.registros = MappingProxyType(registros)
+
+    def con_funciones(self, funciones):
+        """
+        Retorna un ambiente nuevo con estas funciones y además las nuevas
+        """
+        return AmbienteBase(self.funciones + tuple(funciones))
+
+    def get(self, nombre):
+        return self.registros.get(nombre)
+
+    def __iter__(self):
+        return iter(self.registros.values())
+
+
+AMBIENTE_ESTÁNDAR = AmbienteBase([ 
+        ('hacer_menjunje', TipoDatos.NINGUNO),
+        ('viene_bolita', TipoDatos.TEXTO),
+        ('trome', TipoDatos.NÚMERO),
+        ('sueltele', TipoDatos.NINGUNO),
+        ('echandi_jiménez', TipoDatos.TEXTO),
+        ('grítele', TipoDatos.TEXTO), # recibe un texto y lo retorna en mayúsculas
+        ('susúrrele', TipoDatos.TEXTO), # recibe un texto y lo retorna en minúsculas
+        ('déjelo_parejo', TipoDatos.ENTERO) # recibe un número flotante, lo redondea y lo retorna como entero
+    ])
+
 
 class TablaSímbolos:
     """ 
     Almacena información auxiliar para decorar el árbol de sintáxis
     abstracta con información de tipo y alcance.
 
-    La estructura de símbolos es una lista de diccionarios 
+    Cada registro es un diccionario (nombre, profundidad, referencia). Se
+    guardan dos veces:
+        - símbolos: nombre -> pila de registros con ese nombre, para
+          buscar sin recorrer toda la tabla
+        - alcances: una lista de registros por cada bloque abierto, para
+          sacar solo los del bloque al cerrarlo
+
+    Debajo de todo está el ambiente base (las funciones nativas), que es
+    compartido y no se toca.
     """
 
-    profundidad : int  = 0
-    símbolos : List[Dict] = []
+    profundidad : int
+    símbolos : Dict[str, List[Dict]]
+    alcances : List[List[Dict]]
+    base : AmbienteBase
+
+    def __init__(self, base=AMBIENTE_ESTÁNDAR):
+        self.profundidad = 0
+        self.símbolos = {}
+        self.alcances = [[]]
+        self.base = base
 
     def abrir_bloque(self):
         """
         Inicia un bloque de alcance (scope)
         """
         self.profundidad += 1
+        self.alcances.append([])
 
     def cerrar_bloque(self):
         """
         Termina un bloque de alcance y al acerlo elimina todos los
         registros de la tabla que estan en ese bloque
         """
-
-        for registro in self.símbolos:
-            if registro['profundidad'] == self.profundidad:
-                self.símbolos.remove(registro)
+        # Los registros de un bloque son siempre los últimos de la pila de
+        # su nombre (adentro del bloque no se registra nada más afuera)
+        for registro in self.alcances.pop():
+            pila = self.símbolos[registro['nombre']]
+            pila.pop()
+            if not pila:
+                del self.símbolos[registro['nombre']]
 
         self.profundidad -= 1
 
@@ -56,28 +128,38 @@ class TablaSímbolos:
         diccionario['profundidad'] = self.profundidad
         diccionario['referencia']  = nodo
 
-        self.símbolos.append(diccionario)
+        self.símbolos.setdefault(diccionario['nombre'], []).append(diccionario)
+        self.alcances[-1].append(diccionario)
 
     def verificar_existencia(self, nombre):
         """
         Verficia si un identificador existe cómo variable/función global o local
+
+        Cómo siempre, si hay varios registros con el nombre gana el
+        primero que se hizo (el de más abajo en la pila), y antes que
+        todos los del ambiente base
         """
-        for registro in self.símbolos:
+        registro = self.base.get(nombre)
 
-            # si es local
-            if registro['nombre'] == nombre and \
-                    registro['profundidad'] <= self.profundidad:
+        if registro is not None:
+            return registro
 
-                return registro
+        pila = self.símbolos.get(nombre)
 
-        return None
+        if pila is None:
+            return None
+
+        return pila[0]
 
     def __str__(self):
 
         resultado = 'TABLA DE SÍMBOLOS\n\n'
         resultado += 'Profundidad: ' + str(self.profundidad) +'\n\n'
-        for registro in self.símbolos:
-            resultado += str(registro) + '\n'
+        for registro in self.base:
+            resultado += str(dict(registro)) + '\n'
+        for alcance in self.alcances:
+            for registro in alcance:
+                resultado += str(registro) + '\n'
 
         return resultado
 
@@ -90,7 +172,21 @@ class Visitante:
         self.tabla_símbolos = nueva_tabla_símbolos 
         self.errores = errores
 
+        # TipoNodo -> método que lo visita
+        self.__métodos = {}
+
     def visitar(self, nodo: NodoÁrbol):
+        """
+        Visita el nodo y todo su subárbol y retorna el resultado del nodo.
+
+        Los métodos __visitar_* no se llaman entre ellos: hacen yield del
+        nodo hijo que quieren visitar y reciben su resultado. El recorrido
+        lo lleva pila.ejecutar con una pila explícita, así que la
+        profundidad del árbol no está limitada por la recursión de python.
+        """
+        return pila.ejecutar(self.__despachar(nodo), self.__despachar)
+
+    def __despachar(self, nodo):
         """
         Realiza el despacho dinámico para procesar un nodo del árbol.
 
@@ -98,17 +194,23 @@ class Visitante:
             nodo (NodoÁrbol): El nodo AST que se va a visitar.
 
         Retorna:
-            El resultado de invocar el método específico para el tipo de nodo.
+            El resultado de invocar el método específico para el tipo de nodo
+            (un generador si el método visita otros nodos).
 
-        Imprime el error y detiene el programa: 
+        Levanta ErrorFatal: 
             Si no existe un método asociado al tipo de nodo.
         """
-        # Construye nombre del método a partir del tipo de nodo
-        method_name = f"_Visitante__visitar_{nodo.tipo.name.lower()}"
-        method = getattr(self, method_name, None)
+        method = self.__métodos.get(nodo.tipo)
+
         if method is None:
-            print(f"FATAL: no existe un método para visitar nodo de tipo {nodo.tipo} en línea {nodo.linea} columna {nodo.columna}")
-            sys.exit(1)
+            # Construye nombre del método a partir del tipo de nodo (una
+            # sola vez por tipo)
+            method_name = f"_Visitante__visitar_{nodo.tipo.name.lower()}"
+            method = getattr(self, method_name, None)
+            if method is None:
+                raise ErrorFatal(f"FATAL: no existe un método para visitar nodo de tipo {nodo.tipo} en línea {nodo.linea} columna {nodo.columna}")
+            self.__métodos[nodo.tipo] = method
+
         return method(nodo)
 
     def __visitar_programa(self, nodo_actual):
@@ -119,7 +221,7 @@ class Visitante:
             # acá 'self' quiere decir que al método 'visitar' le paso el
             # objetto visitante que estoy usando (o sea, este mismo...
             # self)
-            nodo.visitar(self)
+            yield nodo
 
     def __visitar_switch_case(self, nodo_actual: NodoÁrbol):
         """
@@ -129,11 +231,11 @@ class Visitante:
         - nodo_actual.nodos[0]: expresión de control
         - nodo_actual.nodos[1:]: nodos MOVIDA o SINO (default)
         """
-        tipo_control = nodo_actual.nodos[0].visitar(self)
+        tipo_control = (yield nodo_actual.nodos[0])
         # Procesar cada caso
         for caso in nodo_actual.nodos[1:]:
             if caso.tipo is TipoNodo.MOVIDA:
-                valor = caso.nodos[0].visitar(self)
+                valor = (yield caso.nodos[0])
                 if valor != tipo_control:
                     self.errores.append(
                         ErrorCompilacion(
@@ -144,13 +246,12 @@ class Visitante:
                         )
                     )
                 for inst in caso.nodos[1].nodos:
-                    inst.visitar(self)
+                    yield inst
             elif caso.tipo is TipoNodo.SINO:
                 for inst in caso.nodos[0].nodos:
-                    inst.visitar(self)
+                    yield inst
             else:
-                print(f"FATAL: Nodo inesperado en switch-case: {caso.tipo} en línea {caso.linea} columna {caso.columna}")
-                sys.exit(1)
+                raise ErrorFatal(f"FATAL: Nodo inesperado en switch-case: {caso.tipo} en línea {caso.linea} columna {caso.columna}")
         # El switch-case no produce un valor específico, asignamos CUALQUIERA
         nodo_actual.atributos['tipo'] = TipoDatos.CUALQUIERA
         return TipoDatos.CUALQUIERA
@@ -163,7 +264,7 @@ class Visitante:
         - nodo_actual.nodos[0]: valor del case
         - nodo_actual.nodos[1]: bloque de instrucciones
         """
-        return nodo_actual.nodos[0].visitar(self)
+        return (yield nodo_actual.nodos[0])
     
     def __visitar_try_catch(self, nodo_actual: NodoÁrbol):
         """
@@ -175,10 +276,10 @@ class Visitante:
         """
         # Visitar bloque try
         for inst in nodo_actual.nodos[0].nodos:
-            inst.visitar(self)
+            yield inst
         # Visitar bloque catch
         for inst in nodo_actual.nodos[1].nodos:
-            inst.visitar(self)
+            yield inst
         # Semánticamente, el try-catch como instrucción no devuelve un tipo concreto,
         # usamos CUALQUIERA para indicar que puede manejar múltiples tipos.
         nodo_actual.atributos['tipo'] = TipoDatos.CUALQUIERA
@@ -198,14 +299,14 @@ class Visitante:
         # Abrir nuevo scope para variables del for
         self.tabla_símbolos.abrir_bloque()
         # Visitar inicialización
-        nodo_actual.nodos[0].visitar(self)
+        yield nodo_actual.nodos[0]
         # Evaluar condición
-        nodo_actual.nodos[1].visitar(self)
+        yield nodo_actual.nodos[1]
         # Ejecutar cuerpo del bucle
         for inst in nodo_actual.nodos[3].nodos:
-            inst.visitar(self)
+            yield inst
         # Aplicar incremento
-        nodo_actual.nodos[2].visitar(self)
+        yield nodo_actual.nodos[2]
         # Cerrar scope del for
         self.tabla_símbolos.cerrar_bloque()
         # El for no devuelve un valor concreto, usamos CUALQUIERA
@@ -234,8 +335,8 @@ class Visitante:
                     )
                 )
 
-        lado_izquierdo.visitar(self)
-        lado_derecho.visitar(self)
+        yield lado_izquierdo
+        yield lado_derecho
 
         # Si es una función verifico el tipo que retorna para incluirlo en
         # la asignación y si es un literal puedo anotar el tipo (TIPO) 
@@ -266,17 +367,34 @@ class Visitante:
                         )
                     )
 
-            nodo.visitar(self)
+            yield nodo
 
         # Anoto el tipo de datos 'NÚMERO' (TIPO)
         nodo_actual.atributos['tipo'] = TipoDatos.NÚMERO
 
     def __visitar_expresión(self, nodo_actual):
         """
-        Expresión ::= ExpresiónMatemática Operador ExpresiónMatemática
+        Expresión ::= Operando (Operador Operando)+
+
+        Los operandos ya no vienen envueltos en una ExpresiónMatemática
+        así que los identificadores se revisan acá también
         """
         for nodo in nodo_actual.nodos:
-            nodo.visitar(self)
+
+            # Verifico que exista si es un identificador (IDENTIFICACIÓN)
+            if nodo.tipo == TipoNodo.IDENTIFICADOR:
+                registro = self.tabla_símbolos.verificar_existencia(nodo.contenido)
+                if registro is None:
+                    self.errores.append(
+                        ErrorCompilacion(
+                            mensaje=f"Identificador no declarado '{nodo.contenido}'",
+                            texto=nodo.contenido,
+                            linea=nodo.linea,
+                            columna=nodo.columna
+                        )
+                    )
+
+            yield nodo
 
         # Anoto el tipo de datos 'NÚMERO' (TIPO)
         nodo_actual.atributos['tipo'] = TipoDatos.NÚMERO
@@ -292,7 +410,7 @@ class Visitante:
         self.tabla_símbolos.abrir_bloque()
 
         for nodo in nodo_actual.nodos:
-            nodo.visitar(self)
+            yield nodo
 
         self.tabla_símbolos.cerrar_bloque()
 
@@ -308,8 +426,7 @@ class Visitante:
         # Verfica que el 'Identificador' exista (IDENTIFICACIÓN) y que sea
         registro = self.tabla_símbolos.verificar_existencia(nodo_actual.nodos[0].contenido)
         if registro is None:
-            print(f"FATAL: Función {nodo_actual.nodos[0].contenido} no declarada en línea {nodo_actual.nodos[0].linea} columna {nodo_actual.nodos[0].columna}")
-            sys.exit(1)
+            raise ErrorFatal(f"FATAL: Función {nodo_actual.nodos[0].contenido} no declarada en línea {nodo_actual.nodos[0].linea} columna {nodo_actual.nodos[0].columna}")
 
         if registro['referencia'].tipo != TipoNodo.FUNCIÓN:
             self.errores.append(
@@ -322,7 +439,7 @@ class Visitante:
             )
 
         for nodo in nodo_actual.nodos:
-            nodo.visitar(self)
+            yield nodo
 
         # El tipo resultado de la invocación es el tipo inferido de una
         # función previamente definida
@@ -364,7 +481,7 @@ class Visitante:
                 )
 
             # Si es número o texto nada más los visito
-            nodo.visitar(self)
+            yield nodo
 
         # No hay tipos en los parámetros... se sabe en tiempo de ejecución
 
@@ -377,7 +494,7 @@ class Visitante:
         # Registro cada 'Identificador' en la tabla
         for nodo in nodo_actual.nodos:
                 self.tabla_símbolos.nuevo_registro(nodo)
-                nodo.visitar(self)
+                yield nodo
 
 
     def __visitar_instrucción(self, nodo_actual):
@@ -392,10 +509,10 @@ class Visitante:
         # Lo pongo así por copy/paste... pero puede ser como el comentario
         # de más abajo.
         for nodo in nodo_actual.nodos:
-            nodo.visitar(self)
+            yield nodo
             nodo_actual.atributos['tipo'] = nodo.atributos['tipo']
 
-        # nodo_actual.nodos[0].visitar(self)
+        # yield nodo_actual.nodos[0]
 
     def __visitar_repetición(self, nodo_actual):
         """
@@ -411,9 +528,9 @@ class Visitante:
         self.tabla_símbolos.abrir_bloque()
 
         for nodo in nodo_actual.nodos:
-            nodo.visitar(self)
+            yield nodo
 
-        # nodo_actual.nodos[0].visitar(self)
+        # yield nodo_actual.nodos[0]
 
         self.tabla_símbolos.cerrar_bloque()
 
@@ -428,7 +545,7 @@ class Visitante:
 
         # Visita los dos nodos en el siguiente nivel si los hay
         for nodo in nodo_actual.nodos:
-            nodo.visitar(self)
+            yield nodo
 
         nodo_actual.atributos['tipo'] = TipoDatos.CUALQUIERA 
 
@@ -448,9 +565,9 @@ class Visitante:
         self.tabla_símbolos.abrir_bloque()
 
         for nodo in nodo_actual.nodos:
-            nodo.visitar(self)
+            yield nodo
 
-        # nodo_actual.nodos[0].visitar(self)
+        # yield nodo_actual.nodos[0]
 
         self.tabla_símbolos.cerrar_bloque()
 
@@ -468,9 +585,9 @@ class Visitante:
         self.tabla_símbolos.abrir_bloque()
 
         for nodo in nodo_actual.nodos:
-            nodo.visitar(self)
+            yield nodo
 
-        # nodo_actual.nodos[0].visitar(self)
+        # yield nodo_actual.nodos[0]
 
         self.tabla_símbolos.cerrar_bloque()
 
@@ -479,11 +596,11 @@ class Visitante:
 
     def __visitar_condición(self, nodo_actual):
         """
-        Condición ::= Comparación ((divorcio|casorio) Comparación)?
+        Condición ::= Comparación ((divorcio|casorio) Comparación)*
         """
 
         for nodo in nodo_actual.nodos:
-            nodo.visitar(self)
+            yield nodo
 
         # Comparación retorna un valor de verdad (TIPO)
         nodo_actual.atributos['tipo'] = TipoDatos.VALOR_VERDAD
@@ -508,7 +625,7 @@ class Visitante:
                         )
                     )
 
-            nodo.visitar(self)
+            yield nodo
 
 
         # Verifico que los tipos coincidan (TIPO)
@@ -567,7 +684,7 @@ class Visitante:
         """
 
         for nodo in nodo_actual.nodos:
-            nodo.visitar(self)
+            yield nodo
         
         if nodo_actual.nodos == []:
             # Si no retorna un valor no retorna un tipo específico 
@@ -577,7 +694,7 @@ class Visitante:
 
             for nodo in nodo_actual.nodos:
 
-                nodo.visitar(self)
+                yield nodo
 
                 if nodo.tipo == TipoNodo.IDENTIFICADOR:
                     # Verifico si valor es un identificador que exista (IDENTIFICACIÓN)
@@ -631,9 +748,9 @@ class Visitante:
         # Lo pongo así por copy/paste... pero puede ser como el comentario
         # de más abajo.
         for nodo in nodo_actual.nodos:
-            nodo.visitar(self)
+            yield nodo
 
-        # nodo_actual.nodos[0].visitar(self)
+        # yield nodo_actual.nodos[0]
 
         # Anoto el tipo de retorno (TIPO)
         nodo_actual.atributos['tipo'] = nodo_actual.nodos[0].atributos['tipo']
@@ -658,7 +775,7 @@ class Visitante:
         """
         # Visita todas las instrucciones que contiene
         for nodo in nodo_actual.nodos:
-            nodo.visitar(self)
+            yield nodo
 
         # Acá yo debería agarrar el tipo de datos del Retorno si lo hay
         nodo_actual.atributos['tipo'] = TipoDatos.NINGUNO 
@@ -674,6 +791,13 @@ class Visitante:
         # Operador para trabajar con números (TIPO)
         nodo_actual.atributos['tipo'] = TipoDatos.NÚMERO
 
+    def __visitar_operador_lógico(self, nodo_actual):
+        """
+        OperadorLógico ::= (divorcio | casorio)
+        """
+        # Junta valores de verdad (TIPO)
+        nodo_actual.atributos['tipo'] = TipoDatos.VALOR_VERDAD
+
     def __visitar_valor_verdad(self, nodo_actual):
         """
         ValorVerdad ::= (True | False)
@@ -725,19 +849,63 @@ class Visitante:
         # No hace nada
 
 
+class CachéVerificación:
+    """
+    Lo que se averiguó de cada elemento del programa (asignación global,
+    función o principal) en las verificaciones anteriores, para no volver
+    a verificar lo que no cambió. Se le pasa al Verificador de cada
+    versión nueva del programa (por ejemplo cada vez que un editor guarda
+    el archivo).
+
+    Un elemento se reutiliza si su subárbol es igual al de la vez
+    anterior y los nombres globales que usa tienen la misma firma (tipo
+    de nodo y tipo de datos). Si cambió una función se verifica de
+    nuevo, y si con eso cambió su tipo también los que la usan, y los
+    que usan a esos, etc.
+
+    Ojo que los elementos que no cambiaron quedan en el árbol nuevo con
+    los mismos nodos de la versión anterior. No es para compartir entre
+    hilos: una caché por programa.
+    """
+
+    def __init__(self):
+
+        # (tipo de nodo, nombre, cuántos antes con ese nombre) →
+        # (subárbol ya verificado, identificadores que usa, firmas de los
+        # globales que usa, errores, excepción que lo detuvo o None). Las
+        # firmas son las que deciden si hay que volver a verificar. Si el
+        # árbol es un ÁrbolPlano se guarda una copia del subárbol en
+        # NodoÁrbol (ver desprender) para no mantener vivo todo el árbol
+        # anterior.
+        self.entradas = {}
+
+        # Las funciones nativas con que se llenaron las entradas
+        self.ambiente = None
+
+        # De la última verificación, para saber cuánto se ahorró
+        self.verificados = 0
+        self.reutilizados = 0
+
+
 class Verificador:
 
     asa            : ÁrbolSintáxisAbstracta
     visitador      : Visitante
     tabla_símbolos : TablaSímbolos
 
-    def __init__(self, nuevo_asa: ÁrbolSintáxisAbstracta):
+    def __init__(self, nuevo_asa: ÁrbolSintáxisAbstracta, ambiente=AMBIENTE_ESTÁNDAR, caché=None):
+        """
+        ambiente son las funciones nativas que ve el programa (ver
+        AmbienteBase); se comparte, no se copia. caché es una
+        CachéVerificación para verificar solo lo que cambió desde la
+        vez anterior.
+        """
 
         self.asa            = nuevo_asa
+        self.caché          = caché
 
-        self.tabla_símbolos = TablaSímbolos()
+        self.tabla_símbolos = TablaSímbolos(ambiente)
         self.errores: list[ErrorCompilacion] = []
-        self.__cargar_ambiente_estándar()
 
         self.visitador      = Visitante(self.tabla_símbolos, self.errores)
 
@@ -751,26 +919,415 @@ class Verificador:
         else:
             self.asa.imprimir_preorden()
 
-    def __cargar_ambiente_estándar(self):
+    def verificar(self, procesos=1):
+        """
+        Recorre el árbol, lo decora con los tipos y retorna True si no
+        hubo errores. Si hubo quedan en self.errores; los errores fatales
+        se levantan como ErrorFatal (y si algo más revienta en el
+        Visitante se levanta eso mismo, en cualquiera de los modos).
 
-        funciones_estandar = [ 
-                ('hacer_menjunje', TipoDatos.NINGUNO),
-                ('viene_bolita', TipoDatos.TEXTO),
-                ('trome', TipoDatos.NÚMERO),
-                ('sueltele', TipoDatos.NINGUNO),
-                ('echandi_jiménez', TipoDatos.TEXTO),
-                ('grítele', TipoDatos.TEXTO), # recibe un texto y lo retorna en mayúsculas
-                ('susúrrele', TipoDatos.TEXTO), # recibe un texto y lo retorna en minúsculas
-                ('déjelo_parejo', TipoDatos.ENTERO) # recibe un número flotante, lo redondea y lo retorna como entero
-            ]
+        Con procesos mayor a 1 las funciones se verifican en paralelo
+        (ver __verificar_paralelo) y con caché solo lo que cambió (ver
+        __verificar_incremental), en ese caso procesos no se usa. El
+        resultado es el mismo.
+        """
+        if self.caché is not None:
+            self.__verificar_incremental()
+        elif procesos > 1:
+            self.__verificar_paralelo(procesos)
+        else:
+            self.visitador.visitar(self.asa.raiz)
+
+        return len(self.errores) == 0
+
+    def __verificar_paralelo(self, procesos):
+        """
+        Verifica cada elemento del programa (asignación global, función o
+        principal) por aparte en un grupo de procesos.
 
-        for nombre, tipo in  funciones_estandar:
-            nodo = NodoÁrbol(TipoNodo.FUNCIÓN, contenido=nombre, atributos= {'tipo': tipo})
-            self.tabla_símbolos.nuevo_registro(nodo)
-
-    def verificar(self):
-        self.visitador.visitar(self.asa.raiz)
-        if self.errores:
-            for err in self.errores:
-                print(err)
-            sys.exit(1)
+        Los cuerpos de las funciones solo se tocan a través de los nombres
+        globales, así que primero se hace una pasada rápida que anota qué
+        declara cada elemento y qué nombres usa. Cada elemento ve solo lo
+        declarado antes que él (igual que en el recorrido normal) y se
+        verifica hasta que estén listos los elementos de los que depende,
+        para saber sus tipos. Los que no dependen entre sí van juntos en
+        el mismo nivel.
+
+        Los errores se juntan en el orden del programa, así que quedan
+        igual que verificando en orden. Si algún elemento revienta se
+        levanta lo que reventó primero en ese orden, que es lo que
+        hubiera pasado en orden.
+        """
+        elementos = self.asa.raiz.nodos
+        recorridos = [preorden(elemento) for elemento in elementos]
+        dependencias = self.__dependencias(elementos, recorridos)
+
+        niveles = []
+        for visibles in dependencias:
+            niveles.append(1 + max((niveles[d] for d in visibles.values()), default=-1))
+
+        # Nivel por nivel en el grupo de procesos
+        resultados = [None] * len(elementos)
+        fallidos = set()
+        funciones_ambiente = self.tabla_símbolos.base.funciones
+
+        with ProcessPoolExecutor(max_workers=procesos) as grupo:
+            for nivel in range(max(niveles, default=-1) + 1):
+
+                pedidos = []
+                for número in range(len(elementos)):
+                    if niveles[número] != nivel:
+                        continue
+
+                    # Si algo de lo que depende reventó ya no se verifica
+                    # (en orden tampoco se hubiera llegado)
+                    if any(d in fallidos for d in dependencias[número].values()):
+                        fallidos.add(número)
+                        resultados[número] = ([], [], None)
+                        continue
+
+                    visibles = [(nombre,) + self.__firma(elementos[d]) 
+                            for nombre, d in dependencias[número].items()]
+                    pedidos.append((número, aplanar(recorridos[número]), visibles))
+
+                # Varios pedazos por proceso para que se repartan parejo
+                tamaño_pedazo = max(1, -(-len(pedidos) // (procesos * 4)))
+                pedazos = [pedidos[inicio:inicio + tamaño_pedazo] 
+                        for inicio in range(0, len(pedidos), tamaño_pedazo)]
+
+                for respuestas in grupo.map(verificar_pedazo, pedazos,
+                        [funciones_ambiente] * len(pedazos)):
+
+                    for número, atributos, errores, fatal in respuestas:
+                        for índice, atributos_nodo in atributos:
+                            recorridos[número][índice].atributos.update(atributos_nodo)
+
+                        resultados[número] = (atributos, errores, fatal)
+                        if fatal is not None:
+                            fallidos.add(número)
+
+        for atributos, errores, fatal in resultados:
+            self.errores.extend(errores)
+            if fatal is not None:
+                raise fatal
+
+    def __verificar_incremental(self):
+        """
+        Verifica cada elemento del programa por aparte, en orden, pero
+        solo los que cambiaron desde la vez anterior o usan algo cuya
+        firma cambió. Los demás se comparan con el subárbol de la vez
+        anterior (que es mucho más barato que verificarlos) y se toman
+        sus tipos y errores.
+
+        Los tipos no dependen de dónde está el elemento en el archivo,
+        así que si solo se movió (por ejemplo se agregaron líneas antes)
+        se reutiliza, a menos que tenga errores (que dicen la línea).
+        """
+        caché = self.caché
+        ambiente = self.tabla_símbolos.base
+
+        if caché.ambiente != ambiente.funciones:
+            caché.entradas = {}
+            caché.ambiente = ambiente.funciones
+
+        elementos = self.asa.raiz.nodos
+
+        entradas = {}
+        primera_declaración = {}
+        ocurrencias = {}
+        caché.verificados = 0
+        caché.reutilizados = 0
+        fatal = None
+
+        for número, elemento in enumerate(elementos):
+
+            nombre = self.__nombre_declarado(elemento)
+
+            # Si hay varios elementos con el mismo nombre se distinguen
+            # por el orden
+            clave = (elemento.tipo, nombre)
+            ocurrencias[clave] = ocurrencias.get(clave, -1) + 1
+            clave += (ocurrencias[clave],)
+
+            entrada = caché.entradas.get(clave)
+            iguales = movido = False
+
+            if entrada is not None:
+                anterior, usados, visibles_antes, errores, fatal = entrada
+                iguales, movido = comparar(elemento, anterior)
+
+                # Las posiciones solo importan si hay errores
+                if movido and (errores or fatal):
+                    iguales = False
+
+            if not iguales:
+                usados = {nodo.contenido for nodo in preorden(elemento)
+                        if nodo.tipo is TipoNodo.IDENTIFICADOR}
+
+            visibles = tuple(sorted((usado,) + self.__firma(elementos[primera_declaración[usado]])
+                    for usado in usados if usado in primera_declaración))
+
+            if iguales and visibles == visibles_antes:
+                if not isinstance(elemento, NodoÁrbol):
+                    copiar_tipos(elemento, anterior)
+                    guardado = anterior
+                elif movido:
+                    copiar_tipos(elemento, anterior)
+                    guardado = elemento
+                else:
+                    # Es idéntico, así que se usa el mismo subárbol ya
+                    # decorado en lugar del nuevo
+                    elementos[número] = elemento = guardado = anterior
+                caché.reutilizados += 1
+
+            else:
+                errores, fatal = verificar_subárbol(ambiente, elemento, visibles)
+                guardado = desprender(elemento)
+                caché.verificados += 1
+
+            entradas[clave] = (guardado, usados, visibles, errores, fatal)
+
+            if nombre is not None:
+                primera_declaración.setdefault(nombre, número)
+
+            self.errores.extend(errores)
+
+            # En orden después de un error fatal ya no se sigue
+            if fatal is not None:
+                break
+
+        if fatal is not None:
+            # Lo que no se alcanzó a ver puede servir la próxima vez
+            caché.entradas.update(entradas)
+            # La misma excepción puede salir de la caché varias veces; sin
+            # esto cada vez se le pegaría otro traceback
+            raise fatal.with_traceback(None)
+
+        caché.entradas = entradas
+
+    def __dependencias(self, elementos, recorridos):
+        """
+        Por cada elemento del programa, los nombres globales que usa y
+        que están declarados antes que él, con el número del elemento
+        que los declara (el primero gana, cómo en la tabla de símbolos).
+        recorridos son los nodos de cada elemento en preorden.
+        """
+        primera_declaración = {}
+        usados = []
+
+        for número, elemento in enumerate(elementos):
+            usados.append({nodo.contenido for nodo in recorridos[número]
+                    if nodo.tipo is TipoNodo.IDENTIFICADOR})
+
+            nombre = self.__nombre_declarado(elemento)
+            if nombre is not None:
+                primera_declaración.setdefault(nombre, número)
+
+        return [{nombre: primera_declaración[nombre] for nombre in nombres
+                    if primera_declaración.get(nombre, número) < número}
+                for número, nombres in enumerate(usados)]
+
+    def __nombre_declarado(self, elemento):
+        """
+        El nombre que un elemento del programa agrega a la tabla de
+        símbolos (None para principal)
+        """
+        if elemento.tipo is TipoNodo.FUNCIÓN:
+            return elemento.contenido
+        elif elemento.tipo is TipoNodo.ASIGNACIÓN:
+            return elemento.nodos[0].contenido
+
+        return None
+
+    def __firma(self, elemento):
+        """
+        Lo que ocupan los demás de un elemento ya verificado: el tipo del
+        nodo que queda en la tabla de símbolos y su tipo de datos
+        """
+        if elemento.tipo is TipoNodo.ASIGNACIÓN:
+            elemento = elemento.nodos[0]
+
+        return elemento.tipo.value, elemento.atributos.get('tipo')
+
+    def imprimir_errores(self):
+        """
+        Imprime los errores encontrados en la verificación
+        """
+        for err in self.errores:
+            print(err)
+
+
+def preorden(nodo):
+    """
+    Lista con los nodos del subárbol de nodo en preorden, sin recursión
+    """
+    recorrido = []
+    pendientes = [nodo]
+
+    while pendientes:
+        nodo = pendientes.pop()
+        recorrido.append(nodo)
+        pendientes += nodo.nodos[::-1]
+
+    return recorrido
+
+
+def aplanar(recorrido):
+    """
+    Los nodos de un recorrido en preorden en tuplas (tipo, línea,
+    columna, contenido, cantidad de hijos), que es mucho más barato de
+    mandar a otro proceso que los nodos (y no tiene problemas con la
+    profundidad)
+    """
+    return [(nodo.tipo.value, nodo.linea, nodo.columna, nodo.contenido, len(nodo.nodos))
+            for nodo in recorrido]
+
+
+def comparar(nodo, anterior):
+    """
+    Compara dos subárboles sin ver los atributos. Retorna (si son
+    iguales sin contar las posiciones, si algún nodo cambió de línea o
+    columna)
+    """
+    movido = False
+    pendientes = [nodo]
+    pendientes_anterior = [anterior]
+
+    while pendientes:
+        nodo = pendientes.pop()
+        anterior = pendientes_anterior.pop()
+
+        if nodo.tipo is not anterior.tipo or nodo.contenido != anterior.contenido:
+            return False, False
+
+        hijos = nodo.nodos
+        hijos_anterior = anterior.nodos
+        if len(hijos) != len(hijos_anterior):
+            return False, False
+
+        if nodo.linea != anterior.linea or nodo.columna != anterior.columna:
+            movido = True
+
+        pendientes += hijos
+        pendientes_anterior += hijos_anterior
+
+    return True, movido
+
+
+def copiar_tipos(nodo, anterior):
+    """
+    Le pone a cada nodo del subárbol el tipo del mismo nodo en anterior,
+    que tiene que ser igual (ver comparar)
+    """
+    pendientes = [nodo]
+    pendientes_anterior = [anterior]
+
+    while pendientes:
+        nodo = pendientes.pop()
+        anterior = pendientes_anterior.pop()
+
+        tipo = anterior.atributos.get('tipo')
+        if tipo is not None:
+            nodo.atributos['tipo'] = tipo
+
+        pendientes += nodo.nodos
+        pendientes_anterior += anterior.nodos
+
+
+def desprender(elemento):
+    """
+    El subárbol de elemento ya verificado para guardarlo en la caché.
+    Un NodoÁrbol se guarda tal cual (no apunta al resto del árbol), pero
+    una VistaNodo se copia a NodoÁrbol con sus tipos: si no, la caché
+    mantendría vivo todo el ÁrbolPlano anterior.
+    """
+    if isinstance(elemento, NodoÁrbol):
+        return elemento
+
+    copia = armar(aplanar(preorden(elemento)))
+    copiar_tipos(copia, elemento)
+    return copia
+
+
+def armar(plano):
+    """
+    Lo contrario de aplanar: arma los NodoÁrbol y retorna la raíz
+    """
+    raiz = None
+
+    # [nodo, hijos que le faltan]
+    pendientes = []
+
+    for tipo, linea, columna, contenido, cantidad_hijos in plano:
+        nodo = NodoÁrbol(TIPOS_NODO[tipo], linea, columna, contenido)
+
+        if pendientes:
+            padre = pendientes[-1]
+            padre[0].nodos.append(nodo)
+            padre[1] -= 1
+            if padre[1] == 0:
+                pendientes.pop()
+        else:
+            raiz = nodo
+
+        if cantidad_hijos:
+            pendientes.append([nodo, cantidad_hijos])
+
+    return raiz
+
+
+def verificar_pedazo(pedidos, funciones_ambiente):
+    """
+    Verifica unos elementos del programa en un proceso aparte (ver
+    Verificador.__verificar_paralelo). Tiene que estar a nivel de módulo
+    para que se pueda mandar al otro proceso.
+
+    Cada pedido es (número, subárbol aplanado, nombres visibles) y por
+    cada uno se retorna (número,) más lo que retorna verificar_elemento
+    """
+    ambiente = AmbienteBase(funciones_ambiente)
+
+    return [(número,) + verificar_elemento(ambiente, plano, visibles)
+            for número, plano, visibles in pedidos]
+
+
+def verificar_elemento(ambiente, plano, visibles):
+    """
+    verificar_subárbol pero con el elemento aplanado. Retorna
+    (atributos, errores, la excepción que lo detuvo o None), donde atributos
+    es (posición en preorden, atributos) de los nodos que quedaron con
+    alguno
+    """
+    raiz = armar(plano)
+    errores, fatal = verificar_subárbol(ambiente, raiz, visibles)
+
+    atributos = [(índice, dict(nodo.atributos)) 
+            for índice, nodo in enumerate(preorden(raiz)) if nodo.atributos]
+    return atributos, errores, fatal
+
+
+def verificar_subárbol(ambiente, raiz, visibles):
+    """
+    Verifica (y decora) un elemento del programa viendo solo las
+    funciones nativas y los nombres visibles, que son (nombre, tipo de
+    nodo, tipo de datos). Retorna (errores, la excepción que lo detuvo o
+    None).
+
+    Se atrapa cualquier excepción, no solo ErrorFatal, para que el que
+    llamó la levante en el orden del programa (y desde un proceso aparte
+    llega como un valor más)
+    """
+    tabla = TablaSímbolos(ambiente)
+    for nombre, tipo_nodo, tipo in visibles:
+        atributos = None if tipo is None else {'tipo': tipo}
+        tabla.nuevo_registro(NodoÁrbol(TIPOS_NODO[tipo_nodo], contenido=nombre, atributos=atributos))
+
+    errores = []
+    fatal = None
+
+    try:
+        Visitante(tabla, errores).visitar(raiz)
+    except Exception as error:
+        fatal = error
+
+    return errores, fatal